@@ -0,0 +1,44 @@
+"""
+Command line and report helpers shared by benchmark suites
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from typing import Dict
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def argument_parser(doc: str) -> argparse.ArgumentParser:
+    """Parser with suite module docstring as help text"""
+    return argparse.ArgumentParser(description=doc, formatter_class=argparse.RawDescriptionHelpFormatter)
+
+
+def environment() -> Dict:
+    """Revision and machine fields that start every JSON report"""
+    return {
+        "revision": git_revision(),
+        "timestamp": int(time.time()),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def write_report(report: Dict, output: str | None):
+    """Write JSON report to output file, stdout if omitted"""
+    text = json.dumps(report, indent=2)
+    if output:
+        with open(output, "w") as file:
+            file.write(text)
+    else:
+        print(text)
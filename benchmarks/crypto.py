@@ -0,0 +1,121 @@
+"""
+Wallet cryptography micro-benchmarks
+
+Scenarios: PrivateKey.sign, Sha256Point.verify, Sha256Point.parse (compressed and
+uncompressed, with and without the parse cache), Signature.der / Signature.parse,
+hash160, hash256, encode_base58_checksum and decode_base58.
+Inputs come from a fixed seed, every scenario is warmed up first. Each sample times
+a block of calls, per-call percentiles over the samples are reported in microseconds.
+
+Usage: python -m benchmarks.crypto [--samples N] [--seed N] [--output results.json]
+"""
+import random
+import time
+from typing import Callable, Dict, List
+
+import Crypto
+
+from benchmarks._common import argument_parser, environment, write_report
+from pkg.src.utils import decode_base58, encode_base58_checksum, hash160, hash256
+from pkg.src.wallet import PrivateKey, Sha256Point, Signature
+from pkg.src.wallet.constants import N
+from pkg.src.wallet.sha256point import parse_sec
+
+PERCENTILES = (50, 90, 99)
+
+
+def percentile(values: List[float], pct: int) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))]
+
+
+def bench(func: Callable, inputs: List[tuple], samples: int, block: int, warmup: int) -> Dict:
+    """Per-call times in microseconds, inputs are cycled and each is seen at least once in warm-up"""
+    for index in range(max(warmup, len(inputs))):
+        func(*inputs[index % len(inputs)])
+    times = list()
+    position = 0
+    for _ in range(samples):
+        args = [inputs[(position + i) % len(inputs)] for i in range(block)]
+        position += block
+        start = time.perf_counter()
+        for arg in args:
+            func(*arg)
+        times.append((time.perf_counter() - start) / block * 1e6)
+    result = {"calls": samples * block, "min_us": min(times), "mean_us": sum(times) / len(times)}
+    for pct in PERCENTILES:
+        result[f"p{pct}_us"] = percentile(times, pct)
+    return result
+
+
+def scenarios(keys: int, rng: random.Random) -> Dict[str, tuple]:
+    """name: (function, inputs, calls per sample)"""
+    private_keys = PrivateKey.batch([rng.randrange(1, N) for _ in range(keys)])
+    hashes = [rng.randrange(N) for _ in range(keys)]
+    signatures = [key.sign(z) for key, z in zip(private_keys, hashes)]
+    ders = [signature.der() for signature in signatures]
+    compressed = [key.point.sec() for key in private_keys]
+    uncompressed = [key.point.sec(compressed=False) for key in private_keys]
+    payloads = [rng.randbytes(size) for size in (33, 65, 80, 250) for _ in range(keys)]
+    addresses = [key.point.address() for key in private_keys]
+    return {
+        "sign": (PrivateKey.sign, list(zip(private_keys, hashes)), 1),
+        "verify": (
+            Sha256Point.verify,
+            [(key.point, z, signature) for key, z, signature in zip(private_keys, hashes, signatures)],
+            1
+        ),
+        "verify_uncached_key": (
+            lambda sec, z, signature: parse_sec.__wrapped__(sec).verify(z, signature),
+            list(zip(compressed, hashes, signatures)),
+            1
+        ),
+        "parse_compressed": (parse_sec.__wrapped__, [(sec,) for sec in compressed], 10),
+        "parse_uncompressed": (parse_sec.__wrapped__, [(sec,) for sec in uncompressed], 10),
+        "parse_cached": (Sha256Point.parse, [(sec,) for sec in compressed], 100),
+        "der": (Signature.der, [(signature,) for signature in signatures], 100),
+        "der_parse": (Signature.parse, [(der,) for der in ders], 100),
+        "hash160": (hash160, [(payload,) for payload in payloads], 100),
+        "hash256": (hash256, [(payload,) for payload in payloads], 100),
+        "encode_base58_checksum": (
+            encode_base58_checksum, [(b"\x1c" + hash160(sec),) for sec in compressed], 100
+        ),
+        "decode_base58": (decode_base58, [(address,) for address in addresses], 100),
+    }
+
+
+def main():
+    parser = argument_parser(__doc__)
+    parser.add_argument("--samples", type=int, default=50, help="timed blocks per scenario")
+    parser.add_argument("--keys", type=int, default=64, help="distinct keys and messages")
+    parser.add_argument("--warmup", type=int, default=20, help="untimed calls per scenario")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", help="comma separated scenario names")
+    parser.add_argument("--output", help="JSON file, table on stdout if omitted")
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    selected = args.only.split(",") if args.only else None
+    results = dict()
+    for name, (func, inputs, block) in scenarios(args.keys, rng).items():
+        if selected is None or name in selected:
+            results[name] = bench(func, inputs, args.samples, block, args.warmup)
+
+    if args.output:
+        report = {
+            **environment(),
+            "pycryptodome": Crypto.__version__,
+            "seed": args.seed,
+            "samples": args.samples,
+            "results": results,
+        }
+        write_report(report, args.output)
+        return
+    print(f"{'operation':<24}{'min us':>10}{'mean us':>10}" + "".join(f"{f'p{pct} us':>10}" for pct in PERCENTILES))
+    for name, result in results.items():
+        print(f"{name:<24}{result['min_us']:>10.2f}{result['mean_us']:>10.2f}"
+              + "".join(f"{result[f'p{pct}_us']:>10.2f}" for pct in PERCENTILES))
+
+
+if __name__ == "__main__":
+    main()
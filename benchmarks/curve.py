@@ -0,0 +1,104 @@
+"""
+Int-native curve core vs FieldElement arithmetic: speed and allocations per operation
+
+Reference column runs textbook affine FieldElement code (Point.__rmul__, FieldElement sqrt
+and Point.__init__ curve check), current column runs Sha256Point / PrivateKey as shipped.
+Parsing runs the uncached parser, so repeated SEC bytes measure decompression rather than cache hits.
+Allocations are FieldElement objects created per operation and tracemalloc peak per operation.
+
+Usage: python -m benchmarks.curve [--runs N] [--seed N]
+"""
+import random
+import time
+import tracemalloc
+from typing import Callable, List
+
+from benchmarks._common import argument_parser
+from pkg.src.wallet import FieldElement, Point, PrivateKey, Sha256Field, Sha256Point
+from pkg.src.wallet.constants import A, B, N, P
+from pkg.src.wallet.sha256point import G, parse_sec
+
+FIELD_ELEMENTS = 0
+
+
+def counting_init(init: Callable) -> Callable:
+    def wrapper(self, *args, **kwargs):
+        global FIELD_ELEMENTS
+        FIELD_ELEMENTS += 1
+        init(self, *args, **kwargs)
+    return wrapper
+
+
+def reference_sign(key: PrivateKey, z: int) -> int:
+    k = key.deterministic_k(z)
+    r = Point.__rmul__(G, k).x.num
+    return (z + r * key.secret) * pow(k, N - 2, N) % N
+
+
+def reference_verify(point: Sha256Point, z: int, signature) -> bool:
+    s_inv = pow(signature.s, N - 2, N)
+    total = Point.__rmul__(G, z * s_inv % N) + Point.__rmul__(point, signature.r * s_inv % N)
+    return total.x.num == signature.r
+
+
+def reference_parse(sec: bytes) -> Point:
+    x = Sha256Field(int.from_bytes(sec[1:], "big"))
+    beta = (x ** 3 + Sha256Field(B)).sqrt()
+    if (beta.num % 2 == 0) != (sec[0] == 2):
+        beta = Sha256Field(P - beta.num)
+    return Point(x, beta, Sha256Field(A), Sha256Field(B))
+
+
+def measure(func: Callable, inputs: List[tuple]) -> dict:
+    global FIELD_ELEMENTS
+    FIELD_ELEMENTS = 0
+    start = time.perf_counter()
+    for args in inputs:
+        func(*args)
+    elapsed = time.perf_counter() - start
+    field_elements = FIELD_ELEMENTS / len(inputs)
+
+    tracemalloc.start()
+    func(*inputs[0])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"ms": elapsed / len(inputs) * 1000, "field_elements": field_elements, "peak_bytes": peak}
+
+
+def main():
+    parser = argument_parser(__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    keys = [PrivateKey(rng.randrange(1, N)) for _ in range(args.runs)]
+    hashes = [rng.randrange(N) for _ in range(args.runs)]
+    signatures = [key.sign(z) for key, z in zip(keys, hashes)]
+    FieldElement.__init__ = counting_init(FieldElement.__init__)
+
+    scenarios = {
+        "keygen": (
+            lambda secret: Point.__rmul__(G, secret),
+            lambda secret: PrivateKey(secret),
+            [(key.secret,) for key in keys]
+        ),
+        "sign": (reference_sign, PrivateKey.sign, list(zip(keys, hashes))),
+        "verify": (
+            reference_verify,
+            Sha256Point.verify,
+            [(key.point, z, signature) for key, z, signature in zip(keys, hashes, signatures)]
+        ),
+        "parse_compressed": (reference_parse, parse_sec.__wrapped__, [(key.point.sec(),) for key in keys]),
+    }
+    print(f"{'operation':<18}{'reference ms':>14}{'current ms':>12}{'speedup':>9}"
+          f"{'ref FE/op':>11}{'cur FE/op':>11}{'ref peak B':>12}{'cur peak B':>12}")
+    for name, (reference, current, inputs) in scenarios.items():
+        ref, cur = measure(reference, inputs), measure(current, inputs)
+        print(f"{name:<18}{ref['ms']:>14.3f}{cur['ms']:>12.3f}{ref['ms'] / cur['ms']:>8.1f}x"
+              f"{ref['field_elements']:>11.0f}{cur['field_elements']:>11.0f}"
+              f"{ref['peak_bytes']:>12}{cur['peak_bytes']:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+GLV endomorphism scalar multiplication: correctness check and benchmark
+
+Checks Sha256Point scalar multiplication and verify against the naive
+affine double-and-add Point.__rmul__, then compares timings of
+plain Jacobian double-and-add with GLV split interleaved wNAF.
+
+Usage: python -m benchmarks.glv [--checks N] [--runs N] [--seed N]
+"""
+import random
+import sys
+import time
+
+from benchmarks._common import argument_parser
+from pkg.src.wallet import Point, PrivateKey, Sha256Point
+from pkg.src.wallet import jacobian
+from pkg.src.wallet.constants import N
+from pkg.src.wallet.sha256point import G, VERIFY_WNAF_WIDTH
+
+
+def naive_multiply(point: Sha256Point, scalar: int) -> Sha256Point:
+    return Point.__rmul__(point, scalar % N)
+
+
+def check(checks: int, rng: random.Random) -> int:
+    """Number of mismatches against naive multiplication"""
+    failures = 0
+    edge = [0, 1, 2, N - 1, N, N + 1, jacobian.LAMBDA, N - jacobian.LAMBDA]
+    points = [G] + [PrivateKey(rng.randrange(1, N)).point for _ in range(2)]
+    for point in points:
+        for scalar in edge + [rng.randrange(N) for _ in range(checks)]:
+            k1, k2 = jacobian.glv_split(scalar)
+            if (k1 + k2 * jacobian.LAMBDA - scalar) % N or max(abs(k1), abs(k2)).bit_length() > 129:
+                print(f"Bad split of {scalar:x}: {k1:x}, {k2:x}")
+                failures += 1
+            if scalar * point != naive_multiply(point, scalar):
+                print(f"Mismatch for {scalar:x} * {point}")
+                failures += 1
+    for _ in range(checks):
+        key = PrivateKey(rng.randrange(1, N))
+        z = rng.randrange(N)
+        signature = key.sign(z)
+        if not key.point.verify(z, signature) or key.point.verify(z ^ 1, signature):
+            print(f"Verification mismatch for key {key.hex()}")
+            failures += 1
+    return failures
+
+
+def per_call(func, args) -> float:
+    start = time.perf_counter()
+    for arg in args:
+        func(*arg)
+    return (time.perf_counter() - start) / len(args) * 1000
+
+
+def double_and_add(x: int, y: int, scalar: int):
+    return jacobian.to_affine(jacobian.multiply(x, y, scalar))
+
+
+def glv(x: int, y: int, scalar: int):
+    multiples = jacobian.odd_multiples(x, y, VERIFY_WNAF_WIDTH)
+    terms = jacobian.glv_terms(scalar, multiples, jacobian.endomorphism(multiples), VERIFY_WNAF_WIDTH)
+    return jacobian.to_affine(jacobian.multi_multiply(terms))
+
+
+def main():
+    parser = argument_parser(__doc__)
+    parser.add_argument("--checks", type=int, default=20)
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    failures = check(args.checks, rng)
+    print(f"Correctness: {'OK' if not failures else f'{failures} failures'}")
+
+    point = PrivateKey(rng.randrange(1, N)).point
+    inputs = [(point.x.num, point.y.num, rng.randrange(N)) for _ in range(args.runs)]
+    plain_ms = per_call(double_and_add, inputs)
+    glv_ms = per_call(glv, inputs)
+    print(f"Double-and-add: {plain_ms:.3f} ms")
+    print(f"GLV wNAF:       {glv_ms:.3f} ms")
+    print(f"Speedup:        x{plain_ms / glv_ms:.2f}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Header hashing throughput: BlockHeader.mine loop vs midstate HeaderKernel
+
+Usage: python -m benchmarks.hashing [--hashes N]
+"""
+import time
+
+from benchmarks._common import argument_parser
+from pkg.src.core.blockheader import BlockHeader
+from pkg.src.core.newblocks import NewBlocks
+from pkg.src.mining import HeaderKernel
+from pkg.src.utils import hash256, little_endian_to_int
+
+
+def sample_header() -> BlockHeader:
+    return BlockHeader(1, b"\x11" * 32, b"\x22" * 32, int(time.time()), bytes.fromhex("ffff001d"), 0)
+
+
+def legacy_loop(hashes: int) -> float:
+    """Body of BlockHeader.mine: new block check, full serialize and hash256 per nonce"""
+    header = sample_header()
+    new_block_available = NewBlocks(dict())
+    start = time.perf_counter()
+    for _ in range(hashes):
+        if new_block_available:
+            break
+        header.blockHash = little_endian_to_int(hash256(header.serialize()))
+        header.nonce += 1
+    return time.perf_counter() - start
+
+
+def kernel_loop(hashes: int) -> float:
+    """HeaderKernel.scan over the same number of nonces with unreachable target"""
+    kernel = HeaderKernel.from_header(sample_header())
+    start = time.perf_counter()
+    kernel.scan(0, 0, hashes)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argument_parser(__doc__)
+    parser.add_argument("--hashes", type=int, default=500000)
+    args = parser.parse_args()
+
+    legacy = args.hashes / legacy_loop(args.hashes)
+    kernel = args.hashes / kernel_loop(args.hashes)
+    print(f"BlockHeader.mine loop: {legacy:,.0f} H/s")
+    print(f"HeaderKernel.scan:     {kernel:,.0f} H/s")
+    print(f"Speedup:               x{kernel / legacy:.2f}")
+
+
+if __name__ == "__main__":
+    main()
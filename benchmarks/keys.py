@@ -0,0 +1,56 @@
+"""
+Batch key generation and address derivation: correctness check and throughput
+
+Compares PrivateKey(secret).point.address() one by one with PrivateKey.batch_addresses,
+which walks the fixed-base table for the whole batch with one inversion per table row.
+
+Usage: python -m benchmarks.keys [--count N] [--batch N] [--seed N]
+"""
+import random
+import sys
+import time
+
+from benchmarks._common import argument_parser
+from pkg.src.wallet import PrivateKey
+from pkg.src.wallet.constants import N
+
+
+def one_by_one(secrets):
+    return [PrivateKey(secret).point.address() for secret in secrets]
+
+
+def batched(secrets, batch):
+    addresses = list()
+    for start in range(0, len(secrets), batch):
+        addresses += PrivateKey.batch_addresses(secrets[start:start + batch])
+    return addresses
+
+
+def main():
+    parser = argument_parser(__doc__)
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--batch", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+    secrets = [rng.randrange(1, N) for _ in range(args.count)]
+    # warm up the fixed-base table
+    PrivateKey(1)
+
+    start = time.perf_counter()
+    expected = one_by_one(secrets)
+    single = time.perf_counter() - start
+    start = time.perf_counter()
+    result = batched(secrets, args.batch)
+    batch = time.perf_counter() - start
+
+    failures = sum(a != b for a, b in zip(expected, result)) + abs(len(expected) - len(result))
+    print(f"Correctness: {'OK' if not failures else f'{failures} failures'}")
+    print(f"One by one: {args.count / single:.0f} addresses/sec")
+    print(f"Batch {args.batch}: {args.count / batch:.0f} addresses/sec")
+    print(f"Speedup:    x{single / batch:.2f}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
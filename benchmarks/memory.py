@@ -0,0 +1,118 @@
+"""
+Resident memory of core objects: memory pools and UTXO sets of synthetic transactions
+
+Each scenario is built in a fresh child process, which reports RSS growth and
+tracemalloc bytes per transaction. Entries go through pickle like the ones held by
+memory pool and UTXO Manager processes, so memoized serializations are not counted. The same scenario is also run with __dict__
+based subclasses of the core types for comparison with the slotted ones.
+
+Usage: python -m benchmarks.memory [--mempool 100000] [--utxos 1000000] [--output results.json]
+"""
+import multiprocessing
+import os
+import pickle
+import tracemalloc
+from typing import Dict
+
+from benchmarks._common import argument_parser, environment, write_report
+from pkg.src.core import Script, Tx, TxIn, TxOut
+
+TRACED_SAMPLE = 10000
+
+
+class DictScript(Script):
+    pass
+
+
+class DictTxIn(TxIn):
+    pass
+
+
+class DictTxOut(TxOut):
+    pass
+
+
+class DictTx(Tx):
+    pass
+
+
+TYPES = {
+    "slots": (Script, TxIn, TxOut, Tx),
+    "dict": (DictScript, DictTxIn, DictTxOut, DictTx),
+}
+
+
+def rss() -> int:
+    """Current resident set size in bytes"""
+    with open("/proc/self/statm") as file:
+        return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def make_tx(types: tuple, index: int, inputs: int) -> Tx:
+    """Signed-size P2PKH transaction, script_sig has DER signature and SEC key sized pushes"""
+    script, tx_in, tx_out, tx = types
+    seed = index.to_bytes(8, "little")
+    tx_ins = [
+        tx_in((seed * 4)[:31] + bytes([i]), i, script([seed * 9, seed * 4 + b"\x02"])) for i in range(inputs)
+    ]
+    tx_outs = [
+        tx_out(10 ** 8 + index, script([0x76, 0xA9, (seed * 3)[:20], 0x88, 0xAC])),
+        tx_out(index, script([0x76, 0xA9, (seed * 3)[4:24], 0x88, 0xAC])),
+    ]
+    result = tx(1, tx_ins, tx_outs, 0, 1700000000 + index)
+    result.TxId = result.id()
+    return result
+
+
+def build(kind: str, count: int, inputs: int) -> Dict[str, Tx]:
+    types = TYPES[kind]
+    return {tx.TxId: tx for tx in (pickle.loads(pickle.dumps(make_tx(types, index, inputs))) for index in range(count))}
+
+
+def measure(kind: str, count: int, inputs: int) -> Dict:
+    """Runs in child process"""
+    sample = min(count, TRACED_SAMPLE)
+    tracemalloc.start()
+    entries = build(kind, sample, inputs)
+    traced = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del entries
+
+    start = rss()
+    entries = build(kind, count, inputs)
+    grown = rss() - start
+    return {
+        "entries": len(entries),
+        "traced_bytes_per_tx": traced / sample,
+        "rss_bytes": grown,
+        "rss_bytes_per_tx": grown / count,
+    }
+
+
+def run(kind: str, count: int, inputs: int) -> Dict:
+    with multiprocessing.get_context("fork").Pool(1) as pool:
+        return pool.apply(measure, (kind, count, inputs))
+
+
+def main():
+    parser = argument_parser(__doc__)
+    parser.add_argument("--mempool", type=int, default=100000, help="memory pool transactions (2 inputs each)")
+    parser.add_argument("--utxos", type=int, default=1000000, help="UTXO set entries (1 input each)")
+    parser.add_argument("--kinds", default="slots,dict", help="comma separated object layouts to measure")
+    parser.add_argument("--output", help="JSON file, stdout if omitted")
+    args = parser.parse_args()
+
+    scenarios = {"mempool": (args.mempool, 2), "utxos": (args.utxos, 1)}
+    results = {
+        **environment(),
+        "scenarios": {
+            name: {kind: run(kind, count, inputs) for kind in args.kinds.split(",")}
+            for name, (count, inputs) in scenarios.items()
+        },
+    }
+
+    write_report(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
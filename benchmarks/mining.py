@@ -0,0 +1,151 @@
+"""
+Mining benchmark suite, runs without MongoDB and network
+
+Scenarios:
+- header kernel hash256 throughput
+- merkle_root over 1k/10k/100k tx ids
+- MemoryPool.pick_txs_to_block over synthetic memory pools
+- addBlock template assembly (cold build and per-round update) with BlockTemplate
+
+Usage: python -m benchmarks.mining [--sizes 100,1000,10000,100000] [--output results.json]
+"""
+import random
+import time
+from typing import Callable, Dict, List, Tuple
+
+from benchmarks._common import argument_parser, environment, write_report
+from pkg.src.core import BlockHeader, MemoryPool, Script, Tx, TxIn, TxOut, UTXOs
+from pkg.src.core.tx import CoinbaseTx
+from pkg.src.mining import BlockTemplate, HeaderKernel
+from pkg.src.utils import hash256, merkle_root
+
+ADDRESS = "1BoatSLRHtKNngkdXEeobR76b53LETtpyT"
+SCRIPT_PUBKEY = Script.p2pkh_script(b"\x00" * 20)
+BITS = bytes.fromhex("ffff001d")
+
+
+def best_of(repeat: int, func: Callable[[], float]) -> float:
+    return min(func() for _ in range(repeat))
+
+
+def timed(func: Callable, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def synthetic_pool(size: int, rng: random.Random) -> Tuple[UTXOs, Dict[str, Tx]]:
+    """Unsigned one-input transactions with random fees, each spending own funding output"""
+    utxos = UTXOs(dict(), dict())
+    pool = dict()
+    timestamp = int(time.time())
+    for i in range(size):
+        funding = Tx(1, [TxIn(i.to_bytes(32, "little"), 0)], [TxOut(10 ** 9, SCRIPT_PUBKEY)], 0, timestamp)
+        funding.TxId = funding.id()
+        utxos.add(funding)
+        tx = Tx(1, [TxIn(funding.hash(), 0)], [TxOut(10 ** 9 - rng.randint(1, 10 ** 6), SCRIPT_PUBKEY)], 0, timestamp)
+        tx.TxId = tx.id()
+        pool[tx.TxId] = tx
+    return utxos, pool
+
+
+def bench_kernel(hashes: int, repeat: int) -> Dict:
+    header = BlockHeader(1, b"\x11" * 32, b"\x22" * 32, int(time.time()), BITS, 0)
+    kernel = HeaderKernel.from_header(header)
+    serialized = header.serialize()
+
+    def plain():
+        start = time.perf_counter()
+        for _ in range(hashes):
+            hash256(serialized)
+        return time.perf_counter() - start
+
+    return {
+        "hashes": hashes,
+        "hash256_per_sec": hashes / best_of(repeat, plain),
+        "kernel_hashes_per_sec": hashes / best_of(repeat, lambda: timed(kernel.scan, 0, 0, hashes)),
+    }
+
+
+def bench_merkle_root(counts: List[int], repeat: int, rng: random.Random) -> Dict:
+    results = dict()
+    for count in counts:
+        ids = [rng.randbytes(32) for _ in range(count)]
+        # merkle_root consumes its input list
+        results[str(count)] = best_of(repeat, lambda: timed(merkle_root, list(ids)))
+    return results
+
+
+def assemble(template: BlockTemplate, height: int):
+    """Template part of Blockchain.addBlock round: coinbase, snapshots, header and coinbase branch"""
+    template.refresh()
+    coinbase_tx = CoinbaseTx(height, ADDRESS).build(height, extra_nonce=0)
+    coinbase_tx.tx_outs[0].amount += template.fee
+    coinbase_tx.invalidate()
+    coinbase_tx.TxId = coinbase_tx.id()
+    template.set_coinbase(coinbase_tx)
+    template.transactions()
+    template.tx_ids()
+    BlockHeader(1, b"\x00" * 32, template.merkle_root()[::-1], int(time.time()), BITS, 0)
+    template.merkle_branch()
+
+
+def bench_mem_pool(size: int, repeat: int, rng: random.Random) -> Dict:
+    utxos, pool = synthetic_pool(size, rng)
+
+    def pick():
+        # pick_txs_to_block remembers spent outputs, so every run needs fresh memory pool
+        mem_pool = MemoryPool(dict(pool), utxos)
+        return timed(mem_pool.pick_txs_to_block)
+
+    def cold():
+        return timed(assemble, BlockTemplate(MemoryPool(dict(pool), utxos)), 1)
+
+    def update():
+        """Round after 1% of memory pool was replaced"""
+        mem_pool = MemoryPool(dict(pool), utxos)
+        template = BlockTemplate(mem_pool)
+        assemble(template, 1)
+        changed = rng.sample(sorted(pool), max(1, size // 100))
+        for tx_id in changed:
+            tx = pool[tx_id]
+            mem_pool.remove(tx_id)
+            mem_pool.MemoryPool[tx_id] = tx
+            mem_pool.events.publish(mem_pool.events.TX_ADMITTED, tx_id)
+        return timed(assemble, template, 1)
+
+    template = BlockTemplate(MemoryPool(dict(pool), utxos))
+    assemble(template, 1)
+    return {
+        "block_txs": len(template.transactions()),
+        "pick_txs_to_block": best_of(repeat, pick),
+        "template_cold": best_of(repeat, cold),
+        "template_update": best_of(repeat, update),
+    }
+
+
+def main():
+    parser = argument_parser(__doc__)
+    parser.add_argument("--sizes", default="100,1000,10000,100000", help="comma separated memory pool sizes")
+    parser.add_argument("--merkle", default="1000,10000,100000", help="comma separated tx id counts")
+    parser.add_argument("--hashes", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=3, help="best of N runs is reported")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="JSON file, stdout if omitted")
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    results = {
+        **environment(),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "kernel": bench_kernel(args.hashes, args.repeat),
+        "merkle_root": bench_merkle_root([int(count) for count in args.merkle.split(",")], args.repeat, rng),
+        "mem_pool": {size: bench_mem_pool(int(size), args.repeat, rng) for size in args.sizes.split(",")},
+    }
+
+    write_report(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
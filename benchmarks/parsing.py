@@ -0,0 +1,65 @@
+"""
+Block decode: BytesIO stream parse vs offset based buffer parse
+
+Builds a block of signed P2PKH transactions, checks both parsers give the same
+serialization and reports blocks per second for each.
+
+Usage: python -m benchmarks.parsing [--txs N] [--runs N]
+"""
+import sys
+import time
+from io import BytesIO
+
+from benchmarks._common import argument_parser
+from pkg.src.core import Block, BlockHeader, Script, Tx, TxIn, TxOut
+from pkg.src.core.tx import CoinbaseTx
+from pkg.src.utils import hash160
+from pkg.src.wallet import PrivateKey
+
+ADDRESS = "1BoatSLRHtKNngkdXEeobR76b53LETtpyT"
+
+
+def sample_block(txs: int) -> bytes:
+    key = PrivateKey(12345)
+    script_pubkey = Script.p2pkh_script(hash160(key.point.sec()))
+    transactions = [CoinbaseTx(1, ADDRESS).build(1, extra_nonce=0)]
+    for i in range(txs):
+        tx = Tx(1, [TxIn(i.to_bytes(32, "little"), 0)], [TxOut(10 ** 8, script_pubkey)] * 2, 0, 0)
+        tx.sign_input(0, key, script_pubkey)
+        transactions.append(tx)
+    header = BlockHeader(1, b"\x00" * 32, b"\x11" * 32, 0, bytes.fromhex("ffff001d"), 0)
+    return Block(1, 0, header, len(transactions), transactions).serialize()
+
+
+def per_second(funcs, payload: bytes, runs: int):
+    """Best rate of each parser, runs alternate between parsers to even out machine noise"""
+    best = [0.0] * len(funcs)
+    for _ in range(runs):
+        for index, func in enumerate(funcs):
+            start = time.perf_counter()
+            func(payload)
+            best[index] = max(best[index], 1 / (time.perf_counter() - start))
+    return best
+
+
+def main():
+    parser = argument_parser(__doc__)
+    parser.add_argument("--txs", type=int, default=1000)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+    payload = sample_block(args.txs)
+
+    block, offset = Block.parse_buffer(payload)
+    ok = offset == len(payload) and block.serialize() == Block.parse(BytesIO(payload)).serialize() == payload
+    print(f"Correctness: {'OK' if ok else 'MISMATCH'}")
+
+    stream, buffer = per_second([lambda data: Block.parse(BytesIO(data)), Block.parse_buffer], payload, args.runs)
+    print(f"Block of {args.txs} txs, {len(payload)} bytes")
+    print(f"Stream parse: {stream:.1f} blocks/s")
+    print(f"Buffer parse: {buffer:.1f} blocks/s")
+    print(f"Speedup:      x{buffer / stream:.2f}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Signature hashing of many-input transactions: per input preimage rebuild vs shared SigHashContext
+
+Checks Tx.sigh_hash against the reference full preimage rebuild for every input, then
+reports time to hash all inputs of one transaction.
+
+Usage: python -m benchmarks.sighash [--inputs 10,100,500]
+"""
+import sys
+import time
+
+from benchmarks._common import argument_parser
+from pkg.src.core import Script, Tx, TxIn, TxOut
+from pkg.src.utils import encode_varint, hash256, int_to_little_endian
+
+SCRIPT_PUBKEY = Script.p2pkh_script(b"\x00" * 20)
+
+
+def reference_sigh_hash(tx: Tx, input_index: int, script_pubkey: Script) -> int:
+    """Tx.sigh_hash before SigHashContext: full preimage is rebuilt for every input"""
+    s = int_to_little_endian(tx.version, 4)
+    s += encode_varint(len(tx.tx_ins))
+    for i, tx_in in enumerate(tx.tx_ins):
+        if i == input_index:
+            s += TxIn(tx_in.prev_tx, tx_in.prev_index, script_pubkey).serialize()
+        else:
+            s += TxIn(tx_in.prev_tx, tx_in.prev_index).serialize()
+    s += encode_varint(len(tx.tx_outs))
+    for tx_out in tx.tx_outs:
+        s += TxOut(tx_out.amount, tx_out.script_pubkey).serialize()
+    s += int_to_little_endian(tx.locktime, 4)
+    s += int_to_little_endian(tx.timestamp, 4)
+    s += int_to_little_endian(tx.sig_hash, 4)
+    return int.from_bytes(hash256(s), "big")
+
+
+def sample_tx(inputs: int) -> Tx:
+    tx_ins = [TxIn(i.to_bytes(32, "little"), i % 3, sequence=i) for i in range(inputs)]
+    tx_outs = [TxOut(10 ** 8 + i, Script.p2pkh_script(bytes([i % 256]) * 20)) for i in range(2)]
+    return Tx(1, tx_ins, tx_outs, 7, 1700000000)
+
+
+def all_inputs(func, tx: Tx) -> float:
+    start = time.perf_counter()
+    for index in range(len(tx.tx_ins)):
+        func(tx, index, SCRIPT_PUBKEY)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argument_parser(__doc__)
+    parser.add_argument("--inputs", default="10,100,500", help="comma separated input counts")
+    args = parser.parse_args()
+
+    failures = 0
+    for inputs in [int(count) for count in args.inputs.split(",")]:
+        tx = sample_tx(inputs)
+        if any(tx.sigh_hash(i, SCRIPT_PUBKEY) != reference_sigh_hash(tx, i, SCRIPT_PUBKEY) for i in range(inputs)):
+            print(f"Mismatch for {inputs} inputs")
+            failures += 1
+        reference = all_inputs(reference_sigh_hash, tx)
+        tx.invalidate()
+        current = all_inputs(Tx.sigh_hash, tx)
+        print(f"{inputs:>5} inputs: reference {reference * 1000:9.2f} ms, context {current * 1000:8.2f} ms, "
+              f"x{reference / current:.1f}")
+    print(f"Correctness: {'OK' if not failures else f'{failures} failures'}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import argparse
+import multiprocessing
+import sys
+from multiprocessing import Process
+
+from pkg.src.mining import MinerClient
+
+
+def run_client(host: str, port: int):
+    MinerClient(host, port).run()
+
+
+if __name__ == "__main__":
+    if sys.platform.startswith('win'):
+        multiprocessing.freeze_support()
+    parser = argparse.ArgumentParser(description="Standalone CryptoBridge miner for node job server")
+    parser.add_argument("--host", default="127.0.0.1", help="node host")
+    parser.add_argument("--port", type=int, default=1112, help="node job_port")
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count(), help="num of mining processes")
+    args = parser.parse_args()
+
+    workers = [Process(target=run_client, args=(args.host, args.port)) for _ in range(args.workers)]
+    try:
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+    except KeyboardInterrupt:
+        for worker in workers:
+            worker.kill()
@@ -3,11 +3,12 @@ from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from pkg.api.blocks import BlockRouter
+from pkg.api.mining import MiningRouter
 from pkg.api.nodes import NodesRouter
 from pkg.api.schemas import ErrorResponse
 from pkg.api.txs import TransactionsRouter
 from pkg.api.wallet import WalletRouter
-from pkg.src import MemoryPool, UTXOs
+from pkg.src import MemoryPool, UTXOs, MiningStats
 from pkg.src.mongodb import AsyncBlockchainDB
 
 
@@ -50,7 +51,7 @@ class API:
     async def shutdown():
         pass
 
-    def run(self, utxos: UTXOs, mem_pool: MemoryPool, db_name: str, db_host: str, db_port: int):
+    def run(self, utxos: UTXOs, mem_pool: MemoryPool, mining_stats: MiningStats, db_name: str, db_host: str, db_port: int):
         """Start API server"""
         db: AsyncBlockchainDB = AsyncBlockchainDB(db_name, db_host, db_port)
 
@@ -74,4 +75,9 @@ class API:
             prefix="/nodes",
             tags=["Nodes"]
         )
+        self.app.include_router(
+            MiningRouter(mining_stats).router,
+            prefix="/mining",
+            tags=["Mining"]
+        )
         return self.app
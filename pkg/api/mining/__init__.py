@@ -0,0 +1,3 @@
+from .router import MiningRouter
+
+__all__ = ['MiningRouter']
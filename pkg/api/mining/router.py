@@ -0,0 +1,28 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from pkg.api.schemas import MiningStatsResponse
+from pkg.src import MiningStats
+
+
+class MiningRouter:
+    def __init__(self, mining_stats: MiningStats):
+        self.router = APIRouter()
+        self.router.add_api_route(
+            "/stats",
+            self.get_stats,
+            methods=["GET"],
+            response_model=MiningStatsResponse,
+            summary="Get Mining Stats"
+        )
+
+        self.mining_stats: MiningStats = mining_stats
+
+    async def get_stats(self):
+        """
+        Get mining telemetry of the node.
+
+        Returns:
+        - **MiningStatsResponse**: Hashrate per worker, template age, round statistics.
+        """
+        return JSONResponse(content=MiningStatsResponse(data=self.mining_stats.to_dict()).dict())
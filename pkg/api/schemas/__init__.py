@@ -1,6 +1,7 @@
 from .blocks import BlockResponse, BlockPage, BlocksResponse, BlockTransactionsResponse, BlockTransactionsPage
 from .errors import ErrorResponse
 from .main import Transaction
+from .mining import MiningStatsResponse, MiningStatsResult, WorkerStats
 from .nodes import NodesResponse
 from .transactions import TransactionResponse, TransactionsPageResponse, TransactionsPage, CreateTransaction
 from .wallets import WalletResponse, WalletResult, ValidWalletResponse, ValidWalletResult
@@ -22,4 +23,7 @@ __all__ = [
     'ValidWalletResult',
     'BlockTransactionsResponse',
     'BlockTransactionsPage',
+    'MiningStatsResponse',
+    'MiningStatsResult',
+    'WorkerStats',
 ]
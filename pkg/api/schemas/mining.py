@@ -0,0 +1,29 @@
+from typing import Dict
+
+from pydantic import BaseModel
+
+
+class WorkerStats(BaseModel):
+    hashes: int
+    hashrate: float
+
+
+class MiningStatsResult(BaseModel):
+    hashes: int
+    hashrate: float
+    workers: Dict[str, WorkerStats]
+    template_build_time: float
+    template_age: float | None
+    rounds: int
+    stale_rounds: int
+    stale_work_rate: float
+    time_to_solution: float | None
+    avg_time_to_solution: float | None
+    blocks_won: int
+    blocks_lost: int
+
+
+class MiningStatsResponse(BaseModel):
+    status: str = "success"
+    data: MiningStatsResult
+    details: dict = {}
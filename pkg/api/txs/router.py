@@ -15,7 +15,7 @@ from pkg.api.schemas import (
 )
 from pkg.api.schemas.transactions import FeeRate
 from pkg.api.txs.utils import Send
-from pkg.src import MemoryPool, UTXOs
+from pkg.src import MemoryPool, UTXOs, EventBus
 from pkg.src.core import Tx
 from pkg.src.mongodb import AsyncBlockchainDB
 from pkg.src.network import Broadcaster
@@ -25,6 +25,9 @@ class TransactionsRouter:
     """
     Router for managing blockchain transactions.
     """
+    # Seconds to block worker thread waiting for transaction removal before checking memory pool again
+    WAIT_TIMEOUT = 60
+
     def __init__(self, db: AsyncBlockchainDB, utxos: UTXOs, memory_pool: MemoryPool):
         self.router = APIRouter()
         self.router.add_api_route(
@@ -222,8 +225,9 @@ class TransactionsRouter:
         nodes = await self.db.get_all_nodes()
         Process(target=Broadcaster("").start_broadcast_tx, args=(tx, nodes)).start()
         if wait:
+            subscription = self.memory_pool.events.subscribe(EventBus.TX_REMOVED)
             while tx.TxId in self.memory_pool:
-                await asyncio.sleep(1)
+                await asyncio.to_thread(subscription.wait, self.WAIT_TIMEOUT)
         return JSONResponse(content=TransactionResponse(data=tx.to_dict()).dict())
 
     async def get_tx_from_mem_pool(
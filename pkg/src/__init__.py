@@ -1,8 +1,23 @@
 from .blockchain import Blockchain
+from .core.eventbus import EventBus
 from .core.mempool import MemoryPool
 from .core.newblocks import NewBlocks
 from .core.secondarychain import SecondaryChain
 from .core.utxos import UTXOs
+from .core.verifier import SignatureVerifier
+from .mining import MiningStats
 from .network import SyncManager
+from .wallet import SignatureCache
 
-__all__ = ["Blockchain", "NewBlocks", "SecondaryChain", "UTXOs", "MemoryPool", "SyncManager"]
+__all__ = [
+    "Blockchain",
+    "NewBlocks",
+    "SecondaryChain",
+    "UTXOs",
+    "MemoryPool",
+    "SyncManager",
+    "MiningStats",
+    "EventBus",
+    "SignatureVerifier",
+    "SignatureCache"
+]
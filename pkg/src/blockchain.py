@@ -1,19 +1,20 @@
-import copy
 import time
 from multiprocessing import Process
-from typing import List, Tuple, Dict
+from typing import List, Dict
 
 from logger import init_logger
 from pkg.src.core.block import Block
 from pkg.src.core.blockheader import BlockHeader
+from pkg.src.core.eventbus import EventBus
 from pkg.src.core.mempool import MemoryPool
 from pkg.src.core.newblocks import NewBlocks
 from pkg.src.core.secondarychain import SecondaryChain
 from pkg.src.core.tx import CoinbaseTx, Tx
 from pkg.src.core.utxos import UTXOs
+from pkg.src.mining import BlockTemplate, JobServer, Miner, MiningStats
 from pkg.src.mongodb import BlockchainDB
 from pkg.src.network import SignUpNode, Broadcaster
-from pkg.src.utils import merkle_root, target_to_bits, bits_to_target, get_target_and_timestamp, adjust_target, \
+from pkg.src.utils import target_to_bits, bits_to_target, get_target_and_timestamp, adjust_target, \
     RESET_DIFFICULTY_AFTER_BLOCKS
 
 logger = init_logger("blockchain")
@@ -30,22 +31,28 @@ class Blockchain:
             mem_pool: MemoryPool,
             new_block_available: NewBlocks,
             secondary_chain: SecondaryChain,
+            events: EventBus,
             local_host: str,
             local_port: int,
             db_name: str,
             db_host: str,
             db_port: int,
             parent_node: str,
-            mine: bool = True
+            mine: bool = True,
+            mining_workers: int = 1,
+            job_port: int = 0,
+            mining_stats: MiningStats | None = None
     ):
         # Global containers
         self.utxos: UTXOs = utxos
         self.MemPool: MemoryPool = mem_pool
         self.newBlockAvailable: NewBlocks = new_block_available
         self.secondaryChain: SecondaryChain = secondary_chain
+        self.events: EventBus = events
+        self.miningStats: MiningStats | None = mining_stats
 
         # Local containers
-        self.spent_transactions: List[Tuple[bytes, int]] = list()
+        self.template: BlockTemplate = BlockTemplate(mem_pool)
         self.addTransactionsInBlock: List[Tx] = list()
         self.TxIds: List[bytes] = list()
         self.fee: int = 0
@@ -59,6 +66,8 @@ class Blockchain:
         self.current_node: str = f"{local_host}:{local_port}"
         self.parent_node: str = parent_node
         self.mine: bool = mine
+        self.miner: Miner = Miner(mining_workers, mining_stats)
+        self.jobServer: JobServer | None = JobServer(local_host, job_port, self.miner) if mine and job_port else None
 
         # Data bases
         self.db: BlockchainDB = BlockchainDB(db_name, db_host, db_port)
@@ -98,7 +107,8 @@ class Blockchain:
 
     def read_transaction_from_memory_pool(self):
         """ Read Transactions from Memory Pool"""
-        self.addTransactionsInBlock, self.spent_transactions, self.TxIds, self.fee, self.BlockSize = self.MemPool.pick_txs_to_block()
+        self.template.refresh()
+        self.fee, self.BlockSize = self.template.fee, self.template.size
 
     def LostCompetition(self):
         """Algorithm if another miner has mined the block"""
@@ -119,7 +129,9 @@ class Blockchain:
                     self.utxos.add(tx)
                     self.utxos.delete(tx.tx_ins)
                     self.MemPool.remove(tx)
+                self.template.connect_block(block)
                 self.db.save_block(block.to_dict())
+                self.events.publish(EventBus.BLOCK_CONNECTED, block.BlockHeader.generateBlockHash())
             else:
                 self.resolve_conflict(block)
         self.newBlockAvailable.delete(delete_block)
@@ -179,14 +191,14 @@ class Blockchain:
                                         if tx_in.prev_tx.hex() in self.utxos:
                                             tx = self.utxos.get(tx_in.prev_tx.hex())
                                             tx.tx_outs[tx_in.prev_index] = prev_tx.tx_outs[tx_in.prev_index]
+                                            tx.invalidate()
                                             self.utxos.add(tx)
                                         else:
                                             self.utxos.add(prev_tx)
                                 orphan_txs[tx.id()] = tx
                             self.secondaryChain.add(orphan_block)
 
-                    for add_block in add_blocks[::-1]:
-                        valid_block = copy.deepcopy(add_block)
+                    for valid_block in add_blocks[::-1]:
                         for index, tx in enumerate(valid_block.Txs):
                             tx.TxId = tx.id()
                             self.utxos.add(tx)
@@ -201,6 +213,8 @@ class Blockchain:
                                 self.MemPool.add(orphan_txs[TxId])
                             except Exception as e:
                                 logger.error(f"Incorrect transaction {e}")
+                    self.template.reset()
+                    self.events.publish(EventBus.REORG, add_blocks[0].BlockHeader.generateBlockHash())
             else:
                 """Update blockchain and try again"""
                 self.syncNode()
@@ -212,52 +226,72 @@ class Blockchain:
         self.secondaryChain.add(block)
 
     def wait_for_new_block(self):
-        while True:
-            if self.newBlockAvailable:
-                return
+        """Block until other node sends new block"""
+        subscription = self.events.subscribe(EventBus.BLOCK_RECEIVED)
+        while not self.newBlockAvailable:
+            subscription.wait()
 
     def addBlock(self, block_height, prev_block_hash, miner_address):
         self.secondaryChain.clear(block_height)
-        self.read_transaction_from_memory_pool()
-
-        coinbase = CoinbaseTx(block_height, miner_address)
-        coinbaseTx = coinbase.build(block_height)
-        self.BlockSize += len(coinbaseTx.serialize())
-        coinbaseTx.tx_outs[0].amount = coinbaseTx.tx_outs[0].amount + self.fee
-        coinbaseTx.TxId = coinbaseTx.id()
-        self.TxIds.insert(0, bytes.fromhex(coinbaseTx.id()))
-        self.addTransactionsInBlock.insert(0, coinbaseTx)
-
-        merkleRoot = merkle_root(self.TxIds)[::-1]
         self.adjust_target_difficulty(block_height)
-        block_header = BlockHeader(
-            version=VERSION,
-            prev_block_hash=prev_block_hash,
-            merkle_root=merkleRoot,
-            timestamp=int(time.time()),
-            bits=self.bits,
-            nonce=0
-        )
-        if self.mine:
-            competition_over = block_header.mine(self.current_target, self.newBlockAvailable)
-        else:
-            competition_over = True
-            self.wait_for_new_block()
+
+        competition_over = None
+        while competition_over is None:
+            template_start = time.time()
+            self.read_transaction_from_memory_pool()
+
+            coinbase = CoinbaseTx(block_height, miner_address)
+            coinbaseTx = coinbase.build(block_height, extra_nonce=0)
+            coinbaseTx.tx_outs[0].amount = coinbaseTx.tx_outs[0].amount + self.fee
+            coinbaseTx.invalidate()
+            coinbaseTx.TxId = coinbaseTx.id()
+            self.template.set_coinbase(coinbaseTx)
+            self.addTransactionsInBlock = self.template.transactions()
+            self.TxIds = self.template.tx_ids()
+
+            block_header = BlockHeader(
+                version=VERSION,
+                prev_block_hash=prev_block_hash,
+                merkle_root=self.template.merkle_root()[::-1],
+                timestamp=int(time.time()),
+                bits=self.bits,
+                nonce=0
+            )
+            if self.miningStats:
+                self.miningStats.record_template(time.time() - template_start)
+            if self.mine:
+                competition_over = self.miner.mine(
+                    block_header,
+                    coinbaseTx,
+                    self.template.merkle_branch(),
+                    self.current_target,
+                    self.newBlockAvailable,
+                    self.template.refresh
+                )
+            else:
+                competition_over = True
+                self.wait_for_new_block()
 
         if competition_over:
+            if self.miningStats:
+                self.miningStats.block_lost()
             self.LostCompetition()
         else:
+            if self.miningStats:
+                self.miningStats.block_won()
+            self.TxIds[0] = coinbaseTx.hash()
+            self.BlockSize += coinbaseTx.size
             new_block = Block(block_height, self.BlockSize, block_header, len(self.addTransactionsInBlock),
                               self.addTransactionsInBlock)
-            block = copy.deepcopy(new_block)
-            Process(target=self.broadcaster.start_broadcast_block, args=(block, self.db.get_all_nodes())).start()
+            Process(target=self.broadcaster.start_broadcast_block, args=(new_block, self.db.get_all_nodes())).start()
             self.MemPool.delete(self.TxIds)
-            for tx in block.Txs:
+            for tx in new_block.Txs:
                 tx.TxId = tx.id()
                 self.utxos.add(tx)
                 self.utxos.delete(tx.tx_ins)
             logger.info(f"Block {block_height} mined successfully with Nonce value of {block_header.nonce}")
             self.db.save_block(new_block.to_dict())
+            self.events.publish(EventBus.BLOCK_CONNECTED, block_header.generateBlockHash())
 
     def syncNode(self):
         """Get latest version of blockchain data"""
@@ -271,6 +305,8 @@ class Blockchain:
         self.utxos.build(self.db.get_blocks())
         self.register.downloadMemPool()
         self.set_target_difficulty()
+        if self.jobServer:
+            self.jobServer.start()
 
         while True:
             start = time.time()
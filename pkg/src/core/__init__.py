@@ -1,16 +1,19 @@
 from .block import Block
 from .blockheader import BlockHeader
+from .eventbus import EventBus
 from .mempool import MemoryPool
 from .newblocks import NewBlocks
 from .script import Script
 from .secondarychain import SecondaryChain
 from .tx import Tx, TxOut, TxIn, CoinbaseTx
 from .utxos import UTXOs
+from .verifier import SignatureVerifier
 
 
 __all__ = [
     "Block",
     "BlockHeader",
+    "EventBus",
     "MemoryPool",
     "NewBlocks",
     "Script",
@@ -19,5 +22,6 @@ __all__ = [
     "TxOut",
     "TxIn",
     "CoinbaseTx",
-    "UTXOs"
+    "UTXOs",
+    "SignatureVerifier"
 ]
@@ -1,11 +1,11 @@
-from copy import deepcopy
+import struct
 from io import BytesIO
 from socket import SocketIO
-from typing import List
+from typing import List, Tuple
 
 from pkg.src.core.tx import Tx
 from pkg.src.core.blockheader import BlockHeader
-from pkg.src.utils import read_varint, encode_varint, little_endian_to_int, int_to_little_endian
+from pkg.src.utils import read_varint, read_varint_buffer, encode_varint, little_endian_to_int, int_to_little_endian
 
 
 class Block:
@@ -13,6 +13,9 @@ class Block:
     Block is a storage container that stores transactions
     """
     command = b'newBlockAvbl'
+    FIELDS = ("Height", "Blocksize", "BlockHeader", "Txcount", "Txs")
+    __slots__ = FIELDS
+    PREFIX = struct.Struct("<II")
 
     def __init__(self, height: int, block_size: int, block_header: BlockHeader, tx_count: int, txs: List[Tx]):
         self.Height: int = height
@@ -34,6 +37,19 @@ class Block:
             transactions.append(Tx.parse(s))
         return cls(height, block_size, block_header, tx_count, transactions)
 
+    @classmethod
+    def parse_buffer(cls, buffer: memoryview | bytes, offset: int = 0) -> Tuple['Block', int]:
+        """Parse block from contiguous payload (bytes or memoryview), returns it with offset past it"""
+        height, block_size = cls.PREFIX.unpack_from(buffer, offset)
+        block_header, offset = BlockHeader.parse_buffer(buffer, offset + cls.PREFIX.size)
+        block_header.blockHash = bytes.fromhex(block_header.generateBlockHash())
+        tx_count, offset = read_varint_buffer(buffer, offset)
+        transactions = []
+        for _ in range(tx_count):
+            tx, offset = Tx.parse_buffer(buffer, offset)
+            transactions.append(tx)
+        return cls(height, block_size, block_header, tx_count, transactions), offset
+
     def serialize(self) -> bytes:
         """Convert Block to bytes"""
         result = int_to_little_endian(self.Height, 4)
@@ -64,12 +80,14 @@ class Block:
         return cls(last_block['Height'], last_block['Blocksize'], block, len(transactions), transactions)
 
     def to_dict(self) -> dict:
-        """Convert Block to dict"""
-        dt = deepcopy(self.__dict__)
-        dt['BlockHeader'] = dt['BlockHeader'].to_dict()
-        for tx_id, tx in enumerate(dt['Txs']):
-            dt['Txs'][tx_id] = tx.to_dict()
-        return dt
+        """Convert Block to dict, block itself is not modified"""
+        return {
+            "Height": self.Height,
+            "Blocksize": self.Blocksize,
+            "BlockHeader": self.BlockHeader.to_dict(),
+            "Txcount": self.Txcount,
+            "Txs": [tx.to_dict() for tx in self.Txs],
+        }
 
     def validateBlock(self, last_block: 'Block', target: bytes = b"") -> bool:
         """Check if block is valid (last block hash and PoW is valid)"""
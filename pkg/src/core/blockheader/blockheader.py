@@ -1,9 +1,17 @@
+import struct
+import time
 from socket import SocketIO
+from typing import Tuple
 
 from pkg.src.utils import hash256, bits_to_target, little_endian_to_int, int_to_little_endian
 
 
 class BlockHeader:
+    MAX_NONCE = 0xFFFFFFFF
+    FIELDS = ("version", "prevBlockHash", "merkleRoot", "timestamp", "bits", "nonce", "blockHash")
+    __slots__ = FIELDS
+    LAYOUT = struct.Struct("<I32s32sI4sI")
+
     def __init__(
             self,
             version: int,
@@ -32,6 +40,13 @@ class BlockHeader:
         nonce = little_endian_to_int(s.read(4))
         return cls(version, prev_block_hash, merkle_root, timestamp, bits, nonce)
 
+    @classmethod
+    def parse_buffer(cls, buffer: bytes | memoryview, offset: int = 0) -> Tuple['BlockHeader', int]:
+        """Parse BlockHeader at offset of a buffer, returns it with offset past it."""
+        version, prev_block_hash, merkle_root, timestamp, bits, nonce = cls.LAYOUT.unpack_from(buffer, offset)
+        header = cls(version, prev_block_hash[::-1], merkle_root[::-1], timestamp, bits, nonce)
+        return header, offset + cls.LAYOUT.size
+
     def serialize(self) -> bytes:
         """Serialize BlockHeader into bytes."""
         result = int_to_little_endian(self.version, 4)
@@ -48,6 +63,10 @@ class BlockHeader:
         while self.blockHash > target:
             if new_block_available:
                 return True
+            if self.nonce > self.MAX_NONCE:
+                # nonce space exhausted, roll timestamp
+                self.nonce = 0
+                self.timestamp = max(self.timestamp + 1, int(time.time()))
             self.blockHash = little_endian_to_int(hash256(self.serialize()))
             self.nonce += 1
         self.blockHash = int_to_little_endian(self.blockHash, 32).hex()[::-1]
@@ -65,9 +84,13 @@ class BlockHeader:
         proof = little_endian_to_int(sha)
         return int_to_little_endian(proof, 32).hex()[::-1]
 
+    def fields(self) -> dict:
+        """Attributes by name"""
+        return {name: getattr(self, name) for name in self.FIELDS}
+
     def to_dict(self) -> dict:
         """Converts the BlockHeader object to a dictionary."""
-        dt = self.__dict__
+        dt = self.fields()
         dt['blockHash'] = self.generateBlockHash()
         dt['prevBlockHash'] = self.prevBlockHash.hex()
         dt['merkleRoot'] = self.merkleRoot.hex()
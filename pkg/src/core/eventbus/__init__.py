@@ -0,0 +1,3 @@
+from .event_bus import EventBus, Subscription
+
+__all__ = ['EventBus', 'Subscription']
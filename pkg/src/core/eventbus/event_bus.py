@@ -0,0 +1,82 @@
+import threading
+import time
+from multiprocessing.managers import ListProxy, ValueProxy, Value
+from typing import Any, List, Tuple
+
+
+class EventBus:
+    """
+    Publish/subscribe of chain and memory pool events between node processes
+    Events are kept in bounded log of (seq, topic, payload), waiters block on shared condition
+    """
+    BLOCK_RECEIVED = "block-received"
+    BLOCK_CONNECTED = "block-connected"
+    TX_ADMITTED = "tx-admitted"
+    TX_REMOVED = "tx-removed"
+    REORG = "reorg"
+
+    LOG_SIZE = 1024
+
+    def __init__(
+            self,
+            events: ListProxy | None = None,
+            condition: threading.Condition | None = None,
+            seq: ValueProxy | None = None
+    ):
+        # Local (single process) bus if shared containers are not given
+        self.events: ListProxy[Tuple[int, str, Any]] = events if events is not None else list()
+        self.condition = condition or threading.Condition()
+        self.seq: ValueProxy[int] = seq or Value("i", 0)
+
+    def publish(self, topic: str, payload: Any = None):
+        with self.condition:
+            seq = self.seq.value + 1
+            self.seq.value = seq
+            self.events.append((seq, topic, payload))
+            if seq % self.LOG_SIZE == 0:
+                del self.events[:-self.LOG_SIZE]
+            self.condition.notify_all()
+
+    def subscribe(self, *topics: str) -> "Subscription":
+        """Subscribe to events published from now on, all topics if none given"""
+        return Subscription(self, topics)
+
+    def since(self, cursor: int) -> Tuple[int, List[Tuple[int, str, Any]] | None]:
+        """Current seq and events after cursor, None if they have already left the log"""
+        with self.condition:
+            seq = self.seq.value
+            if seq == cursor:
+                return seq, []
+            first = self.events[0][0] if seq else 1
+            if cursor + 1 < first:
+                return seq, None
+            return seq, self.events[cursor + 1 - first:]
+
+
+class Subscription:
+    """Cursor in event bus log of one subscriber"""
+    def __init__(self, bus: EventBus, topics: Tuple[str, ...]):
+        self.bus: EventBus = bus
+        self.topics: Tuple[str, ...] = topics
+        self.cursor: int = bus.seq.value
+
+    def poll(self) -> List[Tuple[str, Any]] | None:
+        """
+        New (topic, payload) events without blocking
+        Returns None if subscriber fell behind the log and has to resync its state
+        """
+        self.cursor, events = self.bus.since(self.cursor)
+        if events is None:
+            return None
+        return [(topic, payload) for _, topic, payload in events if not self.topics or topic in self.topics]
+
+    def wait(self, timeout: float | None = None) -> List[Tuple[str, Any]] | None:
+        """Block until events on subscribed topics are published, empty list on timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self.bus.condition:
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                self.bus.condition.wait_for(lambda: self.bus.seq.value != self.cursor, remaining)
+            events = self.poll()
+            if events is None or events or (deadline is not None and time.monotonic() >= deadline):
+                return events
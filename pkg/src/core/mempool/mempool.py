@@ -2,8 +2,11 @@ import time
 from multiprocessing.managers import DictProxy
 from typing import List, Dict, Tuple
 
+from pkg.src.core.eventbus import EventBus
+from pkg.src.core.script import Script
 from pkg.src.core.tx import Tx
 from pkg.src.core.utxos import UTXOs
+from pkg.src.core.verifier import SignatureVerifier
 
 
 class MemoryPool:
@@ -11,10 +14,18 @@ class MemoryPool:
     MAX_BLOCK_SIZE = 1024 * 1024
     BASE_FEE = 100000
 
-    def __init__(self, memory_pool: DictProxy, utxos: UTXOs):
+    def __init__(
+            self,
+            memory_pool: DictProxy,
+            utxos: UTXOs,
+            events: EventBus | None = None,
+            verifier: SignatureVerifier | None = None
+    ):
         self.MemoryPool: DictProxy[str, Tx] = memory_pool
         self.UTXOs = utxos
         self.prevTxs: List[bytes] = []
+        self.events: EventBus = events or EventBus()
+        self.verifier: SignatureVerifier = verifier or SignatureVerifier()
 
     def __contains__(self, tx_id: str) -> bool:
         return tx_id in self.MemoryPool
@@ -25,8 +36,46 @@ class MemoryPool:
 
     def add(self, tx: Tx):
         """Add a transaction to the memory pool."""
+        error = self.add_txs([tx])[0]
+        if error:
+            raise error
+
+    def add_txs(self, txs: List[Tx]) -> List[Exception | None]:
+        """
+        Add a batch of transactions to the memory pool.
+        Signatures of the whole batch are verified at once, returns per transaction errors.
+        Fee rate grows with the batch as if transactions passing other checks were already in the pool.
+        """
+        errors: List[Exception | None] = [None] * len(txs)
+        inputs: List[Tuple[Tx, int, Script]] = list()
+        owners: List[int] = list()
+        pool_size = self.get_size()
+        for tx_index, tx in enumerate(txs):
+            try:
+                tx_inputs = self.check_tx(tx, self.fee_rate(pool_size))
+            except Exception as e:
+                errors[tx_index] = e
+                continue
+            pool_size += tx.size
+            inputs.extend(tx_inputs)
+            owners.extend([tx_index] * len(tx_inputs))
+
+        for tx_index, error in zip(owners, self.verifier.input_errors(inputs)):
+            if error and not errors[tx_index]:
+                errors[tx_index] = error
+
+        for tx, error in zip(txs, errors):
+            if not error:
+                tx_id = tx.id()
+                self.MemoryPool[tx_id] = tx
+                self.events.publish(EventBus.TX_ADMITTED, tx_id)
+        return errors
+
+    def check_tx(self, tx: Tx, fee_rate: int) -> List[Tuple[Tx, int, Script]]:
+        """Check everything but signatures, returns inputs left to verify"""
         input_amount = 0
         output_amount = 0
+        inputs = list()
         current_time = int(time.time())
         if not (current_time >= tx.timestamp > current_time - 3600):
             raise Exception("Incorrect timestamp")
@@ -36,28 +85,28 @@ class MemoryPool:
                 raise Exception("Incorrect input")
             if not prev_tx.tx_outs[tx_in.prev_index]:
                 raise Exception("Double spending")
-            script = prev_tx.tx_outs[tx_in.prev_index].script_pubkey
-            if not tx.verify_input(index, script):
-                raise Exception("Verification error")
+            inputs.append((tx, index, prev_tx.tx_outs[tx_in.prev_index].script_pubkey))
             input_amount += prev_tx.tx_outs[tx_in.prev_index].amount
         for tx_out in tx.tx_outs:
             output_amount += tx_out.amount
-        fee = len(tx.serialize()) * self.get_fee_rate()
+        fee = len(tx.serialize()) * fee_rate
         if output_amount >= input_amount + fee:
             raise Exception("Insufficient balance")
-        self.MemoryPool[tx.id()] = tx
+        return inputs
 
     def remove(self, tx: Tx | str | bytes):
         """Remove a transaction from the memory pool."""
+        if type(tx) is str:
+            tx_id = tx
+        elif type(tx) is bytes:
+            tx_id = tx.hex()
+        else:
+            tx_id = tx.id()
         try:
-            if type(tx) is str:
-                del self.MemoryPool[tx]
-            elif type(tx) is bytes:
-                del self.MemoryPool[tx.hex()]
-            else:
-                del self.MemoryPool[tx.id()]
+            del self.MemoryPool[tx_id]
         except KeyError:
-            pass
+            return
+        self.events.publish(EventBus.TX_REMOVED, tx_id)
 
     def delete(self, txs: List[Tx | str | bytes]):
         """Delete a transactions from the memory pool."""
@@ -70,10 +119,19 @@ class MemoryPool:
 
     def get_fee_rate(self) -> int:
         """Get avg. fee/tx_size rate from memory pool."""
+        return self.fee_rate(self.get_size())
+
+    def get_size(self) -> int:
+        """Total size of memory pool transactions"""
         size = 0
         for tx in self.MemoryPool.values():
             size += tx.size
-        return int(max(1, size // self.MAX_BLOCK_SIZE) * self.BASE_FEE)
+        return size
+
+    @classmethod
+    def fee_rate(cls, size: int) -> int:
+        """Fee/tx_size rate for memory pool of given size"""
+        return int(max(1, size // cls.MAX_BLOCK_SIZE) * cls.BASE_FEE)
     
     def double_spending(self, tx: Tx) -> bool:
         """ Check if it is a double spending Attempt """
@@ -1,16 +1,31 @@
+import multiprocessing
 from multiprocessing.managers import DictProxy
+from multiprocessing.synchronize import Event
 from typing import Dict, List
 
+from pkg.src.core.eventbus import EventBus
 from pkg.src.core.secondarychain import SecondaryChain
 from pkg.src.core.tx import CoinbaseTx, Tx
 from pkg.src.core.utxos import UTXOs
+from pkg.src.core.verifier import SignatureVerifier
 from pkg.src.core.block import Block
 from pkg.src.utils import merkle_root
 
 
 class NewBlocks:
-    def __init__(self, new_blocks: DictProxy):
+    def __init__(
+            self,
+            new_blocks: DictProxy,
+            received: Event | None = None,
+            events: EventBus | None = None,
+            verifier: SignatureVerifier | None = None
+    ):
         self.NewBlocks: DictProxy[str, Block] = new_blocks
+        self.events: EventBus = events or EventBus()
+        self.verifier: SignatureVerifier = verifier or SignatureVerifier()
+        # Shared memory flag, lets miners check for new blocks without IPC call to Manager
+        # Created in spawn context so it can be passed to both fork and spawn processes
+        self.received: Event = received or multiprocessing.get_context("spawn").Event()
 
     def add(self, block: Block):
         tx_ids = list()
@@ -21,12 +36,16 @@ class NewBlocks:
         if not block.BlockHeader.check_pow():
             raise Exception("PoW mismatch")
 
-        self.NewBlocks[block.BlockHeader.generateBlockHash()] = block
+        block_hash = block.BlockHeader.generateBlockHash()
+        self.NewBlocks[block_hash] = block
+        self.received.set()
+        self.events.publish(EventBus.BLOCK_RECEIVED, block_hash)
 
     def check_block(self, block: Block, utxos: UTXOs, db, sec_chain: SecondaryChain):
         fee_amount = 0
         mined_amount = 0
         secondary_utxos = self.sec_chain_txs(block, utxos, db, sec_chain)
+        inputs = list()
         for tx in block.Txs:
             if tx.is_coinbase():
                 mined_amount = tx.tx_outs[0].amount
@@ -39,13 +58,13 @@ class NewBlocks:
                         raise Exception(f"Incorrect input {tx_in.prev_tx.hex()}")
                     if not prev_tx.tx_outs[tx_in.prev_index]:
                         raise Exception("Double spending")
-                    script = prev_tx.tx_outs[tx_in.prev_index].script_pubkey
-                    if not tx.verify_input(index, script):
-                        raise Exception("Verification error")
+                    inputs.append((tx, index, prev_tx.tx_outs[tx_in.prev_index].script_pubkey))
                     input_amount += prev_tx.tx_outs[tx_in.prev_index].amount
                 for tx_out in tx.tx_outs:
                     output_amount += tx_out.amount
                 fee_amount += input_amount - output_amount
+        if not all(self.verifier.verify_inputs(inputs)):
+            raise Exception("Verification error")
         if mined_amount - fee_amount > CoinbaseTx.REWARD(block.Height):
             raise Exception("Too big mined amount")
 
@@ -76,6 +95,7 @@ class NewBlocks:
                         if tx_in.prev_tx.hex() in secondary_utxos:
                             tx = secondary_utxos[tx_in.prev_tx.hex()]
                             tx.tx_outs[tx_in.prev_index] = prev_tx.tx_outs[tx_in.prev_index]
+                            tx.invalidate()
                             secondary_utxos[prev_tx.TxId] = tx
                         else:
                             secondary_utxos[prev_tx.TxId] = prev_tx
@@ -91,6 +111,7 @@ class NewBlocks:
                         if len(secondary_utxos[tx_in.prev_tx.hex()].tx_outs) - secondary_utxos[tx_in.prev_tx.hex()].tx_outs.count(None) > 1:
                             tx = secondary_utxos[tx_in.prev_tx.hex()]
                             tx.tx_outs[tx_in.prev_index] = None
+                            tx.invalidate()
                             secondary_utxos[tx_in.prev_tx.hex()] = tx
                         else:
                             del secondary_utxos[tx_in.prev_tx.hex()]
@@ -106,10 +127,17 @@ class NewBlocks:
             del self.NewBlocks[blockhash]
         except KeyError:
             pass
+        self.refresh()
 
     def delete(self, blocks: List[str]):
         for block in blocks:
             self.remove(block)
 
+    def refresh(self):
+        """Reset received flag if there is no blocks left (cleared first so concurrent add is not lost)"""
+        self.received.clear()
+        if self.NewBlocks:
+            self.received.set()
+
     def __bool__(self):
-        return bool(self.NewBlocks)
+        return self.received.is_set() and bool(self.NewBlocks)
@@ -1,19 +1,27 @@
 from socket import SocketIO
-from typing import List
+from typing import List, Tuple
 
-from pkg.src.wallet import OP_CODE_FUNCTION
-from pkg.src.utils import encode_varint, read_varint, int_to_little_endian, little_endian_to_int
+from pkg.src.wallet import OP_CODE_FUNCTION, OPCode
+from pkg.src.utils import (
+    hash160, encode_varint, read_varint, read_varint_buffer, int_to_little_endian, little_endian_to_int
+)
 
 
 class Script:
+    FIELDS = ("cmds",)
+    __slots__ = FIELDS + ("serialized",)
+
     def __init__(self, cmds: List = None):
         self.cmds = cmds if cmds is not None else list()
+        self.serialized: bytes | None = None
 
     def __add__(self, other: 'Script') -> 'Script':
         return Script(self.cmds + other.cmds)
 
     def serialize(self) -> bytes:
         """Convert script into bytes"""
+        if self.serialized is not None:
+            return self.serialized
         result = b""
         for cmd in self.cmds:
             # if the cmd is an integer, it's an opcode
@@ -42,7 +50,21 @@ class Script:
         # get the length of the whole thing
         total = len(result)
         # encode_varint the total length of the result and prepend
-        return encode_varint(total) + result
+        self.serialized = encode_varint(total) + result
+        return self.serialized
+
+    def invalidate(self):
+        """Drop memoized serialization, must follow any change of cmds"""
+        self.serialized = None
+
+    def __getstate__(self) -> dict:
+        """Memoized serialization is not pickled, it is rebuilt on demand"""
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    def __setstate__(self, state: dict):
+        for name, value in state.items():
+            setattr(self, name, value)
+        self.serialized = None
 
     @classmethod
     def parse(cls, s: SocketIO) -> 'Script':
@@ -88,8 +110,50 @@ class Script:
             raise SyntaxError('Parsing script failed')
         return cls(cmds)
 
-    def evaluate(self, z: int) -> bool:
-        """Check if script is valid"""
+    @classmethod
+    def parse_buffer(cls, buffer: bytes | memoryview, offset: int = 0) -> Tuple['Script', int]:
+        """Parse script at offset of a buffer, returns it with offset past the script"""
+        length, offset = read_varint_buffer(buffer, offset)
+        end = offset + length
+        if end > len(buffer):
+            raise SyntaxError('Parsing script failed')
+        cmds = []
+        while offset < end:
+            current_byte = buffer[offset]
+            offset += 1
+            # pushes must be encoded as serialize() does, otherwise raw tx bytes would not match its id
+            if 1 <= current_byte < 75:
+                # push of the next current_byte bytes
+                data_length = current_byte
+            elif current_byte == 76:
+                # op_pushdata1
+                data_length = buffer[offset]
+                offset += 1
+                if data_length <= 75:
+                    raise SyntaxError('Non-canonical script push')
+            elif current_byte == 77:
+                # op_pushdata2
+                data_length = buffer[offset] | buffer[offset + 1] << 8
+                offset += 2
+                if not 0x100 <= data_length <= 520:
+                    raise SyntaxError('Non-canonical script push')
+            elif current_byte == 75:
+                # serialize() has no encoding for 75 byte push
+                raise SyntaxError('Non-canonical script push')
+            else:
+                cmds.append(current_byte)
+                continue
+            cmds.append(bytes(buffer[offset:offset + data_length]))
+            offset += data_length
+        if offset != end:
+            raise SyntaxError('Parsing script failed')
+        return cls(cmds), offset
+
+    def evaluate(self, z: int, checks: List | None = None) -> bool:
+        """
+        Check if script is valid
+        If checks list is given, signature checks are collected there instead of being verified
+        """
         cmds = self.cmds[:]
         stack = []
         while len(cmds) > 0:
@@ -97,7 +161,10 @@ class Script:
             if type(cmd) is int:
                 operation = OP_CODE_FUNCTION[cmd]
                 if cmd == 172:
-                    if not operation(stack, z):
+                    if checks is not None:
+                        if not OPCode.op_check_sig_deferred(stack, z, checks):
+                            return False
+                    elif not operation(stack, z):
                         return False
                 elif not operation(stack):
                     return False
@@ -105,6 +172,21 @@ class Script:
                 stack.append(cmd)
         return True
 
+    def p2pkh_spend(self, script_pubkey: 'Script') -> Tuple[bytes, bytes] | None:
+        """
+        (SEC pubkey, DER signature) if self is [sig, sec] script_sig spending p2pkh script_pubkey with matching hash160
+        None means script has to go through evaluate
+        """
+        if len(self.cmds) != 2 or len(script_pubkey.cmds) != 5:
+            return None
+        sig, sec = self.cmds
+        dup, op_hash160, h160, equal_verify, check_sig = script_pubkey.cmds
+        if (dup, op_hash160, equal_verify, check_sig) != (0x76, 0xA9, 0x88, 0xAC):
+            return None
+        if type(sig) is int or type(sec) is int or type(h160) is int or hash160(sec) != h160:
+            return None
+        return sec, sig[:-1]
+
     @classmethod
     def p2pkh_script(cls, h160: bytes) -> 'Script':
         """Takes a hash160 and returns the p2pkh ScriptPubKey"""
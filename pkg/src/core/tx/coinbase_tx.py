@@ -19,12 +19,14 @@ class CoinbaseTx:
         self.BlockHeightInLittleEndian: bytes = int_to_little_endian(block_height, bytes_needed(block_height))
         self.MINER_ADDRESS: str = miner_address
 
-    def build(self, bloch_height: int) -> Tx:
+    def build(self, bloch_height: int, extra_nonce: int | None = None) -> Tx:
         """Build coinbase transaction"""
         prev_tx = self.ZERO_HASH
         prev_index = 0xFFFFFFFF
         tx_ins = [TxIn(prev_tx, prev_index)]
         tx_ins[0].script_sig.cmds.append(self.BlockHeightInLittleEndian)
+        if extra_nonce is not None:
+            tx_ins[0].script_sig.cmds.append(int_to_little_endian(extra_nonce, bytes_needed(extra_nonce)))
 
         tx_outs = []
         target_amount = self.REWARD(bloch_height)
@@ -35,3 +37,16 @@ class CoinbaseTx:
         coinbase_tx.TxId = coinbase_tx.id()
 
         return coinbase_tx
+
+    @staticmethod
+    def set_extra_nonce(coinbase_tx: Tx, extra_nonce: int):
+        """
+        Put extra nonce into coinbase script_sig right after block height
+        Changes coinbase TxId, so block merkle root has to be recalculated
+        """
+        cmds = coinbase_tx.tx_ins[0].script_sig.cmds
+        del cmds[1:]
+        cmds.append(int_to_little_endian(extra_nonce, bytes_needed(extra_nonce)))
+        coinbase_tx.invalidate()
+        coinbase_tx.TxId = coinbase_tx.id()
+        coinbase_tx.size = coinbase_tx.calculate_size()
@@ -0,0 +1,41 @@
+from hashlib import sha256
+from typing import List
+
+from pkg.src.core.script import Script
+from pkg.src.utils import int_to_little_endian, encode_varint
+
+
+class SigHashContext:
+    """
+    Signature hash preimage parts shared by all inputs of a transaction
+    Built once per transaction, so hashing every input costs serialization of its script_pubkey only
+    """
+    # Inputs not being signed go into preimage with empty script_sig and default sequence
+    EMPTY_SCRIPT = b"\x00"
+    SEQUENCE = b"\xff\xff\xff\xff"
+    OUTPOINT_SIZE = 36
+    INPUT_SIZE = OUTPOINT_SIZE + len(EMPTY_SCRIPT) + len(SEQUENCE)
+
+    def __init__(self, version: int, outpoints: List[bytes], outputs: List[bytes], locktime: int, timestamp: int,
+                 sig_hash: int):
+        self.head: bytes = int_to_little_endian(version, 4) + encode_varint(len(outpoints))
+        self.inputs: bytes = b"".join(outpoint + self.EMPTY_SCRIPT + self.SEQUENCE for outpoint in outpoints)
+        self.tail: bytes = (
+            encode_varint(len(outputs))
+            + b"".join(outputs)
+            + int_to_little_endian(locktime, 4)
+            + int_to_little_endian(timestamp, 4)
+            + int_to_little_endian(sig_hash, 4)
+        )
+
+    def hash(self, input_index: int, script_pubkey: Script) -> int:
+        """hash256 of preimage with script_pubkey in place of script_sig of input_index"""
+        start = input_index * self.INPUT_SIZE
+        inputs = memoryview(self.inputs)
+        h = sha256(self.head)
+        h.update(inputs[:start + self.OUTPOINT_SIZE])
+        h.update(script_pubkey.serialize())
+        h.update(self.SEQUENCE)
+        h.update(inputs[start + self.INPUT_SIZE:])
+        h.update(self.tail)
+        return int.from_bytes(sha256(h.digest()).digest(), "big")
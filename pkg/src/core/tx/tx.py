@@ -1,25 +1,45 @@
+import struct
 from io import BytesIO
 from socket import SocketIO
-from typing import List
+from typing import List, Tuple
 
-from pkg.src.wallet import PrivateKey
+from pkg.src.wallet import OPCode, PrivateKey
 from pkg.src.core.script import Script
+from pkg.src.core.tx.sighash import SigHashContext
 from pkg.src.core.tx.tx_in import TxIn
 from pkg.src.core.tx.tx_out import TxOut
-from pkg.src.utils import hash256, little_endian_to_int, read_varint, int_to_little_endian, bytes_needed, encode_varint
+from pkg.src.utils import (
+    hash256, little_endian_to_int, read_varint, read_varint_buffer, int_to_little_endian, bytes_needed, encode_varint
+)
 
 
 class Tx:
     """Transaction object"""
     command = b'newTxMemPool'
+    FIELDS = ("version", "tx_ins", "tx_outs", "locktime", "sig_hash", "timestamp", "TxId", "size", "fee")
+    __slots__ = FIELDS + ("serialized", "tx_hash", "sig_hash_context")
+    VERSION = struct.Struct("<I")
+    TRAILER = struct.Struct("<II")
 
-    def __init__(self, version: int, tx_ins: List[TxIn], tx_outs: List[TxOut], locktime: int, timestamp: int):
+    def __init__(
+            self,
+            version: int,
+            tx_ins: List[TxIn],
+            tx_outs: List[TxOut],
+            locktime: int,
+            timestamp: int,
+            serialized: bytes | None = None
+    ):
         self.version: int = version
         self.tx_ins: List[TxIn] = tx_ins
         self.tx_outs: List[TxOut | None] = tx_outs
         self.locktime: int = locktime
         self.sig_hash: int = 1
         self.timestamp: int = timestamp
+        # Memoized serialize() and hash(), invalidate() drops them after changes
+        self.serialized: bytes | None = serialized
+        self.tx_hash: bytes | None = None
+        self.sig_hash_context: SigHashContext | None = None
         self.TxId: str = self.id()
         self.size: int = self.calculate_size()
         self.fee: int = 0
@@ -30,7 +50,31 @@ class Tx:
 
     def hash(self) -> bytes:
         """Binary Has of serialization"""
-        return hash256(self.serialize())[::-1]
+        if self.tx_hash is None:
+            self.tx_hash = hash256(self.serialize())[::-1]
+        return self.tx_hash
+
+    def invalidate(self):
+        """Drop memoized serialization and hashes of tx and its parts, must follow any change of them"""
+        self.serialized = None
+        self.tx_hash = None
+        self.sig_hash_context = None
+        for tx_in in self.tx_ins:
+            tx_in.invalidate()
+        for tx_out in self.tx_outs:
+            if tx_out:
+                tx_out.invalidate()
+
+    def __getstate__(self) -> dict:
+        """Memoized fields are not pickled into memory pool or UTXOs, they are rebuilt on demand"""
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    def __setstate__(self, state: dict):
+        for name, value in state.items():
+            setattr(self, name, value)
+        self.serialized = None
+        self.tx_hash = None
+        self.sig_hash_context = None
 
     @classmethod
     def parse(cls, s: SocketIO | BytesIO) -> 'Tx':
@@ -53,8 +97,35 @@ class Tx:
         timestamp = little_endian_to_int(s.read(4))
         return cls(version, inputs, outputs, lock_time, timestamp)
 
+    @classmethod
+    def parse_buffer(cls, buffer: memoryview | bytes, offset: int = 0) -> Tuple['Tx', int]:
+        """
+        Parse transaction at offset of a contiguous payload (bytes or memoryview) without stream objects
+        returns a Tx object and offset past it
+        """
+        start = offset
+        version, = cls.VERSION.unpack_from(buffer, offset)
+        num_inputs, offset = read_varint_buffer(buffer, offset + cls.VERSION.size)
+        inputs = []
+        for _ in range(num_inputs):
+            tx_in, offset = TxIn.parse_buffer(buffer, offset)
+            inputs.append(tx_in)
+        num_outputs, offset = read_varint_buffer(buffer, offset)
+        outputs = []
+        for _ in range(num_outputs):
+            tx_out, offset = TxOut.parse_buffer(buffer, offset)
+            if tx_out.amount:
+                outputs.append(tx_out)
+        lock_time, timestamp = cls.TRAILER.unpack_from(buffer, offset)
+        offset += cls.TRAILER.size
+        # varints and pushes are canonical, zero amount outputs are dropped, raw bytes are reused only when nothing was
+        serialized = bytes(buffer[start:offset]) if len(outputs) == num_outputs else None
+        return cls(version, inputs, outputs, lock_time, timestamp, serialized), offset
+
     def serialize(self) -> bytes:
         """Convert Tx object to bytes"""
+        if self.serialized is not None:
+            return self.serialized
         result = int_to_little_endian(self.version, 4)
         result += encode_varint(len(self.tx_ins))
         for tx_in in self.tx_ins:
@@ -64,25 +135,21 @@ class Tx:
             result += tx_out.serialize()
         result += int_to_little_endian(self.locktime, 4)
         result += int_to_little_endian(self.timestamp, 4)
+        self.serialized = result
         return result
 
     def sigh_hash(self, input_index: int, script_pubkey: Script) -> int:
         """Create transaction hash so nobody can replace elements inside"""
-        s = int_to_little_endian(self.version, 4)
-        s += encode_varint(len(self.tx_ins))
-        for i, tx_in in enumerate(self.tx_ins):
-            if i == input_index:
-                s += TxIn(tx_in.prev_tx, tx_in.prev_index, script_pubkey).serialize()
-            else:
-                s += TxIn(tx_in.prev_tx, tx_in.prev_index).serialize()
-        s += encode_varint(len(self.tx_outs))
-        for tx_out in self.tx_outs:
-            s += tx_out.serialize()
-        s += int_to_little_endian(self.locktime, 4)
-        s += int_to_little_endian(self.timestamp, 4)
-        s += int_to_little_endian(self.sig_hash, 4)
-        h256 = hash256(s)
-        return int.from_bytes(h256, "big")
+        if self.sig_hash_context is None:
+            self.sig_hash_context = SigHashContext(
+                self.version,
+                [tx_in.prev_tx[::-1] + int_to_little_endian(tx_in.prev_index, 4) for tx_in in self.tx_ins],
+                [tx_out.serialize() for tx_out in self.tx_outs],
+                self.locktime,
+                self.timestamp,
+                self.sig_hash
+            )
+        return self.sig_hash_context.hash(input_index, script_pubkey)
 
     def sign_input(self, input_index: int, private_key: PrivateKey, script_pubkey: Script):
         """Sign tx_in with the given input_index using private key"""
@@ -91,13 +158,32 @@ class Tx:
         sig = der + self.sig_hash.to_bytes(1, "big")
         sec = private_key.point.sec()
         self.tx_ins[input_index].script_sig = Script([sig, sec])
+        # script_sig is not part of signature hash, context stays valid for other inputs
+        context = self.sig_hash_context
+        self.invalidate()
+        self.sig_hash_context = context
 
     def verify_input(self, input_index: int, script_pubkey: Script) -> bool:
-        """Check if tx_in with input_index is correctly signed"""
+        """
+        Check if tx_in with input_index is correctly signed
+        Same checks as SignatureVerifier runs for batches, verified inline without signature cache
+        """
+        checks = self.signature_checks(input_index, script_pubkey)
+        return checks is not None and all([OPCode.check_signature(*check) for check in checks])
+
+    def signature_checks(self, input_index: int, script_pubkey: Script) -> List[Tuple[int, bytes, bytes]] | None:
+        """
+        Run tx_in script without verifying signatures
+        Returns (z, SEC pubkey, DER signature) checks left to verify, None if script itself fails
+        """
         tx_in = self.tx_ins[input_index]
         z = self.sigh_hash(input_index, script_pubkey)
+        spend = tx_in.script_sig.p2pkh_spend(script_pubkey)
+        if spend is not None:
+            return [(z, *spend)]
         combined = tx_in.script_sig + script_pubkey
-        return combined.evaluate(z)
+        checks = list()
+        return checks if combined.evaluate(z, checks) else None
 
     def is_coinbase(self) -> bool:
         """
@@ -148,30 +234,22 @@ class Tx:
 
     def to_dict(self) -> dict:
         """
-        Convert Transaction
+        Convert Transaction, tx itself is not modified
         Convert prev_tx Hash in hex from bytes
         Convert BlockHeight in hex which is stored in Script signature
         """
-        tx_dict = self.__dict__
-        for tx_index, tx_in in enumerate(tx_dict['tx_ins']):
-            if self.is_coinbase():
-                tx_in.script_sig.cmds[0] = little_endian_to_int(
-                    tx_in.script_sig.cmds[0]
-                )
-            tx_in.prev_tx = tx_in.prev_tx.hex()
-            for index, cmd in enumerate(tx_in.script_sig.cmds):
-                if isinstance(cmd, bytes):
-                    tx_in.script_sig.cmds[index] = cmd.hex()
-            tx_in.script_sig = tx_in.script_sig.__dict__
-            tx_dict['tx_ins'][tx_index] = tx_in.__dict__
-        for index, tx_out in enumerate(tx_dict['tx_outs']):
-            if not tx_out:
-                tx_dict['tx_outs'][index] = None
-                continue
-            tx_out.script_pubkey.cmds[2] = tx_out.script_pubkey.cmds[2].hex()
-            tx_out.script_pubkey = tx_out.script_pubkey.__dict__
-            tx_dict['tx_outs'][index] = tx_out.__dict__
-        return tx_dict
+        coinbase = self.is_coinbase()
+        return {
+            "version": self.version,
+            "tx_ins": [tx_in.to_dict(coinbase) for tx_in in self.tx_ins],
+            "tx_outs": [tx_out.to_dict() if tx_out else None for tx_out in self.tx_outs],
+            "locktime": self.locktime,
+            "sig_hash": self.sig_hash,
+            "timestamp": self.timestamp,
+            "TxId": self.TxId,
+            "size": self.size,
+            "fee": self.fee,
+        }
 
     def calculate_fee(self, utxos) -> float:
         """Calculate transaction fee amount (diff btw amount of inputs and outputs)"""
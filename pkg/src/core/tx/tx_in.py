@@ -1,4 +1,6 @@
+import struct
 from socket import SocketIO
+from typing import Tuple
 
 from pkg.src.core.script import Script
 from pkg.src.utils import int_to_little_endian, little_endian_to_int
@@ -9,20 +11,54 @@ class TxIn:
     Input transaction:
     Collect required amounts to transfer on another wallet
     """
+    FIELDS = ("prev_tx", "prev_index", "script_sig", "sequence")
+    __slots__ = FIELDS + ("serialized",)
+    OUTPOINT = struct.Struct("<32sI")
+    SEQUENCE = struct.Struct("<I")
 
     def __init__(self, prev_tx: bytes, prev_index: int, script_sig: Script | None = None, sequence: int = 0xFFFFFFFF):
         self.prev_tx: bytes = prev_tx
         self.prev_index: int = prev_index
         self.script_sig = script_sig or Script()
         self.sequence = sequence
+        self.serialized: bytes | None = None
 
     def serialize(self) -> bytes:
         """Convert TxIb into bytes"""
-        result = self.prev_tx[::-1]
-        result += int_to_little_endian(self.prev_index, 4)
-        result += self.script_sig.serialize()
-        result += int_to_little_endian(self.sequence, 4)
-        return result
+        if self.serialized is None:
+            result = self.prev_tx[::-1]
+            result += int_to_little_endian(self.prev_index, 4)
+            result += self.script_sig.serialize()
+            result += int_to_little_endian(self.sequence, 4)
+            self.serialized = result
+        return self.serialized
+
+    def invalidate(self):
+        """Drop memoized serialization"""
+        self.serialized = None
+        self.script_sig.invalidate()
+
+    def __getstate__(self) -> dict:
+        """Memoized serialization is not pickled, it is rebuilt on demand"""
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    def __setstate__(self, state: dict):
+        for name, value in state.items():
+            setattr(self, name, value)
+        self.serialized = None
+
+    def to_dict(self, coinbase: bool = False) -> dict:
+        """Dict with hex prev_tx and script_sig pushes, coinbase block height and extra nonce become ints"""
+        if coinbase:
+            cmds = [little_endian_to_int(cmd) for cmd in self.script_sig.cmds]
+        else:
+            cmds = [cmd.hex() if isinstance(cmd, bytes) else cmd for cmd in self.script_sig.cmds]
+        return {
+            "prev_tx": self.prev_tx.hex(),
+            "prev_index": self.prev_index,
+            "script_sig": {"cmds": cmds},
+            "sequence": self.sequence,
+        }
 
     @classmethod
     def parse(cls, s: SocketIO) -> 'TxIn':
@@ -32,3 +68,11 @@ class TxIn:
         script_sig = Script.parse(s)
         sequence = little_endian_to_int(s.read(4))
         return cls(prev_tx, prev_index, script_sig, sequence)
+
+    @classmethod
+    def parse_buffer(cls, buffer: bytes | memoryview, offset: int) -> Tuple['TxIn', int]:
+        """Parse TxIn at offset of a buffer, returns it with offset past it"""
+        prev_tx, prev_index = cls.OUTPOINT.unpack_from(buffer, offset)
+        script_sig, offset = Script.parse_buffer(buffer, offset + cls.OUTPOINT.size)
+        sequence, = cls.SEQUENCE.unpack_from(buffer, offset)
+        return cls(prev_tx[::-1], prev_index, script_sig, sequence), offset + cls.SEQUENCE.size
@@ -1,4 +1,6 @@
+import struct
 from socket import SocketIO
+from typing import Tuple
 
 from pkg.src.core.script import Script
 from pkg.src.utils import int_to_little_endian, little_endian_to_int
@@ -9,16 +11,40 @@ class TxOut:
     Output transaction:
     Transfer
     """
+    FIELDS = ("amount", "script_pubkey")
+    __slots__ = FIELDS + ("serialized",)
+    AMOUNT = struct.Struct("<Q")
 
     def __init__(self, amount: int, script_pubkey: Script):
         self.amount: int = amount
         self.script_pubkey: Script = script_pubkey
+        self.serialized: bytes | None = None
 
     def serialize(self) -> bytes:
         """Serialise TxOut into bytes"""
-        result = int_to_little_endian(self.amount, 8)
-        result += self.script_pubkey.serialize()
-        return result
+        if self.serialized is None:
+            self.serialized = int_to_little_endian(self.amount, 8) + self.script_pubkey.serialize()
+        return self.serialized
+
+    def invalidate(self):
+        """Drop memoized serialization"""
+        self.serialized = None
+        self.script_pubkey.invalidate()
+
+    def __getstate__(self) -> dict:
+        """Memoized serialization is not pickled, it is rebuilt on demand"""
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    def __setstate__(self, state: dict):
+        for name, value in state.items():
+            setattr(self, name, value)
+        self.serialized = None
+
+    def to_dict(self) -> dict:
+        """Dict with hex public key hash of p2pkh script_pubkey"""
+        cmds = list(self.script_pubkey.cmds)
+        cmds[2] = cmds[2].hex()
+        return {"amount": self.amount, "script_pubkey": {"cmds": cmds}}
 
     @classmethod
     def parse(cls, s: SocketIO) -> 'TxOut':
@@ -26,3 +52,10 @@ class TxOut:
         amount = little_endian_to_int(s.read(8))
         script_pubkey = Script.parse(s)
         return cls(amount, script_pubkey)
+
+    @classmethod
+    def parse_buffer(cls, buffer: bytes | memoryview, offset: int) -> Tuple['TxOut', int]:
+        """Parse TxOut at offset of a buffer, returns it with offset past it"""
+        amount, = cls.AMOUNT.unpack_from(buffer, offset)
+        script_pubkey, offset = Script.parse_buffer(buffer, offset + cls.AMOUNT.size)
+        return cls(amount, script_pubkey), offset
@@ -49,6 +49,7 @@ class UTXOs:
                 if len(self.utxos[tx.prev_tx.hex()].tx_outs) - self.utxos[tx.prev_tx.hex()].tx_outs.count(None) > 1:
                     prev_tx = self.get(tx.prev_tx.hex())
                     prev_tx.tx_outs[tx.prev_index] = None
+                    prev_tx.invalidate()
                     self.add(prev_tx)
                 else:
                     del self.utxos[tx.prev_tx.hex()]
@@ -85,6 +86,7 @@ class UTXOs:
                         else:
                             tx_outs = all_txs[tx_in.prev_tx.hex()].tx_outs
                             tx_outs[tx_in.prev_index] = None
+                            all_txs[tx_in.prev_tx.hex()].invalidate()
 
         for tx in all_txs:
             self.add(all_txs[tx])
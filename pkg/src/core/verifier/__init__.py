@@ -0,0 +1,3 @@
+from .verifier import SignatureVerifier
+
+__all__ = ['SignatureVerifier']
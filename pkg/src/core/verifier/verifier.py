@@ -0,0 +1,117 @@
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from typing import List, Tuple
+
+from pkg.src.core.script import Script
+from pkg.src.core.tx import Tx
+from pkg.src.wallet import OPCode, SignatureCache
+
+
+def verify_signature(z: int, sec_pubkey: bytes, der_signature: bytes) -> bool:
+    """Pool task, same check as Tx.verify_input runs inline"""
+    return OPCode.check_signature(z, sec_pubkey, der_signature)
+
+
+class SignatureVerifier:
+    """
+    Verifies batches of (sighash z, SEC pubkey, DER signature) on persistent process pool
+    Pool is started on first big batch in the process that uses the verifier, with workers=1 checks run inline.
+    Processes that only check single transactions should get inline verifier sharing the same cache.
+    Checks found in signature cache are not verified again, successful ones are recorded there
+    """
+    # Smaller batches are verified inline, pool round trip is not worth it
+    MIN_PARALLEL = 16
+
+    def __init__(self, workers: int = 0, cache: SignatureCache | None = None):
+        self.workers: int = workers or os.cpu_count() or 1
+        self.cache: SignatureCache = cache or SignatureCache()
+        self.executor: ProcessPoolExecutor | None = None
+        self.pid: int | None = None
+        # Connection handler threads verify concurrently, only one of them may start the pool
+        self.lock: threading.Lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.update(executor=None, pid=None)
+        del state["lock"]
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    def inline(self) -> 'SignatureVerifier':
+        """Verifier without process pool, sharing signature cache with this one"""
+        return SignatureVerifier(1, self.cache)
+
+    def pool(self) -> ProcessPoolExecutor:
+        with self.lock:
+            if self.executor is None or self.pid != os.getpid():
+                # Spawned workers do not inherit sockets and threads of node processes
+                self.executor = ProcessPoolExecutor(self.workers, mp_context=get_context("spawn"))
+                self.pid = os.getpid()
+            return self.executor
+
+    def discard(self, executor: ProcessPoolExecutor):
+        """Shut down broken pool, next batch starts a new one"""
+        with self.lock:
+            if self.executor is executor:
+                self.executor = None
+        executor.shutdown(wait=False)
+
+    def verify(self, checks: List[Tuple[int, bytes, bytes]]) -> List[bool]:
+        """Per check verification results"""
+        results = [True] * len(checks)
+        pending = [index for index, check in enumerate(checks) if check not in self.cache]
+        for index, valid in zip(pending, self.verify_uncached([checks[index] for index in pending])):
+            results[index] = valid
+            if valid:
+                self.cache.add(*checks[index])
+        return results
+
+    def verify_uncached(self, checks: List[Tuple[int, bytes, bytes]]) -> List[bool]:
+        if self.workers < 2 or len(checks) < self.MIN_PARALLEL:
+            return [verify_signature(*check) for check in checks]
+        chunk_size = -(-len(checks) // (self.workers * 4))
+        executor = self.pool()
+        try:
+            return list(executor.map(verify_signature, *zip(*checks), chunksize=chunk_size))
+        except BrokenProcessPool:
+            self.discard(executor)
+            return [verify_signature(*check) for check in checks]
+
+    def verify_inputs(self, inputs: List[Tuple[Tx, int, Script]]) -> List[bool]:
+        """Per input results for (tx, input index, script pubkey of spent output) batch"""
+        return [error is None for error in self.input_errors(inputs)]
+
+    def input_errors(self, inputs: List[Tuple[Tx, int, Script]]) -> List[Exception | None]:
+        """
+        Per input errors for (tx, input index, script pubkey of spent output) batch, None for valid input
+        Failure of one malformed input does not affect the rest of the batch
+        """
+        input_checks: List[List[Tuple[int, bytes, bytes]] | Exception] = list()
+        for tx, index, script_pubkey in inputs:
+            try:
+                checks = tx.signature_checks(index, script_pubkey)
+            except Exception as e:
+                checks = e
+            input_checks.append(Exception("Verification error") if checks is None else checks)
+        results = iter(self.verify([
+            check for checks in input_checks if not isinstance(checks, Exception) for check in checks
+        ]))
+        errors: List[Exception | None] = list()
+        for checks in input_checks:
+            if isinstance(checks, Exception):
+                errors.append(checks)
+            else:
+                errors.append(None if all([next(results) for _ in checks]) else Exception("Verification error"))
+        return errors
+
+    def shutdown(self):
+        with self.lock:
+            executor, self.executor = self.executor, None
+        if executor is not None and self.pid == os.getpid():
+            executor.shutdown()
@@ -0,0 +1,8 @@
+from .client import MinerClient
+from .kernel import HeaderKernel
+from .miner import Miner
+from .server import JobServer
+from .stats import MiningStats
+from .template import BlockTemplate
+
+__all__ = ['HeaderKernel', 'Miner', 'BlockTemplate', 'JobServer', 'MinerClient', 'MiningStats']
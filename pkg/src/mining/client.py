@@ -0,0 +1,80 @@
+import time
+from threading import Event, Thread
+
+from logger import init_logger
+from pkg.src.mining.miner import mine_template
+from pkg.src.mining.protocol import RequestMiningJob, RequestJobId, JobId, MiningJob, SubmitWork, WorkResult
+from pkg.src.network import Publisher
+from pkg.src.network.network import NetworkEnvelope
+
+logger = init_logger("miner_client")
+
+
+class MinerClient:
+    """Standalone miner: pulls jobs from node JobServer and submits found solutions"""
+    POLL_INTERVAL = 5
+
+    def __init__(self, host: str, port: int):
+        self.host: str = host
+        self.port: int = port
+
+    def request(self, message) -> NetworkEnvelope:
+        """Send single request to job server and read the answer"""
+        publisher = Publisher(self.host, self.port)
+        try:
+            publisher.sendRequest(message)
+            return NetworkEnvelope.parse(publisher.stream)
+        finally:
+            publisher.close()
+
+    def getJob(self) -> MiningJob | None:
+        envelope = self.request(RequestMiningJob)
+        if envelope.command == MiningJob.command:
+            return MiningJob.parse(envelope.stream())
+        return None
+
+    def getJobId(self) -> int | None:
+        """Id of current job, cheap check whether job has changed"""
+        envelope = self.request(RequestJobId)
+        if envelope.command == JobId.command:
+            return JobId.parse(envelope.stream())
+        return None
+
+    def submitWork(self, job: MiningJob, extra_nonce: int, timestamp: int, nonce: int) -> bool:
+        envelope = self.request(SubmitWork(job.job_id, extra_nonce, timestamp, nonce))
+        return envelope.command == WorkResult.command and WorkResult.parse(envelope.stream())
+
+    def mineJob(self, job: MiningJob):
+        """Search job space in other thread until solution found or node switches to another job"""
+        stop, result = Event(), list()
+        start = time.time()
+        worker = Thread(
+            target=lambda: result.extend(
+                mine_template(job.block_header, job.coinbase_tx, job.branch, job.target, job.slot, stop)
+            ),
+            daemon=True
+        )
+        worker.start()
+        while worker.is_alive():
+            worker.join(self.POLL_INTERVAL)
+            if worker.is_alive():
+                if self.getJobId() != job.job_id:
+                    stop.set()
+        solution, hashes = result
+        elapsed = time.time() - start
+        logger.info(f"Job {job.job_id}: {hashes} hashes, {hashes / elapsed if elapsed else 0:.0f} H/s")
+        if solution:
+            accepted = self.submitWork(job, *solution)
+            logger.info(f"Solution for job {job.job_id} {'accepted' if accepted else 'rejected'}")
+
+    def run(self):
+        logger.info(f"Mining for node {self.host}:{self.port}")
+        while True:
+            try:
+                job = self.getJob()
+                if job:
+                    self.mineJob(job)
+                    continue
+            except Exception as e:
+                logger.error(f"JOB SERVER ERROR: {e}")
+            time.sleep(self.POLL_INTERVAL)
@@ -0,0 +1,60 @@
+import struct
+from hashlib import sha256
+
+from pkg.src.core.blockheader import BlockHeader
+
+STOP_CHECK_INTERVAL = 1000
+
+
+class HeaderKernel:
+    """
+    Midstate PoW hashing kernel
+    Header is serialized once, SHA-256 state of its first 64 bytes is reused and only nonce bytes are patched per hash
+    """
+    HEADER_SIZE = 80
+    MIDSTATE_SIZE = 64
+    NONCE = struct.Struct("<I")
+    NONCE_OFFSET = HEADER_SIZE - MIDSTATE_SIZE - NONCE.size
+
+    def __init__(self, header: bytes):
+        if len(header) != self.HEADER_SIZE:
+            raise ValueError(f"Header must be {self.HEADER_SIZE} bytes")
+        self.midstate = sha256(header[:self.MIDSTATE_SIZE])
+        self.tail: bytearray = bytearray(header[self.MIDSTATE_SIZE:])
+        self.hashes: int = 0
+
+    @classmethod
+    def from_header(cls, block_header: BlockHeader) -> 'HeaderKernel':
+        """Build kernel from BlockHeader (nonce is ignored)"""
+        return cls(block_header.serialize())
+
+    def hash(self, nonce: int) -> bytes:
+        """hash256 of the header with given nonce"""
+        self.NONCE.pack_into(self.tail, self.NONCE_OFFSET, nonce)
+        h = self.midstate.copy()
+        h.update(self.tail)
+        return sha256(h.digest()).digest()
+
+    def scan(self, target: int, start: int, end: int, stop=None) -> int | None:
+        """Search nonce range [start, end) for a header hash below target"""
+        # hash < target is only possible if the hash has at least as many leading zero bytes as target
+        # (little endian digest, so they are trailing bytes of the digest)
+        zero_suffix = b"\0" * (32 - (target.bit_length() + 7) // 8)
+        tail, midstate = self.tail, self.midstate
+        pack_into, offset = self.NONCE.pack_into, self.NONCE_OFFSET
+        from_bytes = int.from_bytes
+
+        for chunk in range(start, end, STOP_CHECK_INTERVAL):
+            if stop is not None and stop.is_set():
+                self.hashes += chunk - start
+                return None
+            for nonce in range(chunk, min(chunk + STOP_CHECK_INTERVAL, end)):
+                pack_into(tail, offset, nonce)
+                h = midstate.copy()
+                h.update(tail)
+                digest = sha256(h.digest()).digest()
+                if digest.endswith(zero_suffix) and from_bytes(digest, "little") < target:
+                    self.hashes += nonce - start + 1
+                    return nonce
+        self.hashes += max(0, end - start)
+        return None
@@ -0,0 +1,185 @@
+import time
+from multiprocessing import Event, Process, Queue
+from queue import Empty
+from typing import Callable, List, Tuple
+
+from logger import init_logger
+from pkg.src.core.blockheader import BlockHeader
+from pkg.src.core.tx import CoinbaseTx, Tx
+from pkg.src.mining.kernel import HeaderKernel
+from pkg.src.mining.stats import MiningStats
+from pkg.src.utils import merkle_root_from_branch
+
+logger = init_logger("miner")
+
+NONCE_SPACE = BlockHeader.MAX_NONCE + 1
+EXTRA_NONCE_BITS = 32
+
+
+def apply_solution(
+        block_header: BlockHeader,
+        coinbase_tx: Tx,
+        branch: List[bytes],
+        extra_nonce: int,
+        timestamp: int,
+        nonce: int
+):
+    """Set extra nonce into coinbase and rebuild header with given timestamp and nonce"""
+    CoinbaseTx.set_extra_nonce(coinbase_tx, extra_nonce)
+    block_header.merkleRoot = merkle_root_from_branch(coinbase_tx.hash(), branch)[::-1]
+    block_header.timestamp = timestamp
+    block_header.nonce = nonce
+
+
+def mine_template(
+        block_header: BlockHeader,
+        coinbase_tx: Tx,
+        branch: List[bytes],
+        target: int,
+        slot: int,
+        stop: Event
+) -> Tuple[Tuple[int, int, int] | None, int]:
+    """
+    Search (extra nonce, timestamp, nonce) space owned by slot
+    Extra nonces are slot << EXTRA_NONCE_BITS | counter, so slots never overlap.
+    Every extra nonce gets full 32-bit nonce space and fresh timestamp.
+    Returns found solution (or None if stopped) and number of computed hashes
+    """
+    hashes = 0
+    for counter in range(1 << EXTRA_NONCE_BITS):
+        extra_nonce = slot << EXTRA_NONCE_BITS | counter
+        timestamp = max(block_header.timestamp, int(time.time()))
+        apply_solution(block_header, coinbase_tx, branch, extra_nonce, timestamp, 0)
+        kernel = HeaderKernel.from_header(block_header)
+        nonce = kernel.scan(target, 0, NONCE_SPACE, stop)
+        hashes += kernel.hashes
+        if nonce is not None:
+            return (extra_nonce, timestamp, nonce), hashes
+        if stop.is_set():
+            break
+    return None, hashes
+
+
+def mining_worker(jobs: Queue, results: Queue, stop: Event):
+    """Worker process loop: search block templates received from the miner"""
+    while True:
+        job = jobs.get()
+        if job is None:
+            return
+        job_id, slot, *template = job
+        start = time.time()
+        solution, hashes = mine_template(*template, slot, stop)
+        results.put((job_id, slot, solution, hashes, time.time() - start))
+
+
+class Miner:
+    """
+    Multi-process PoW engine
+    Every worker process owns disjoint extra nonce slot, first found solution stops the others.
+    Current job is also available for external miners (see JobServer), their solutions are put to results queue.
+    """
+    POLL_INTERVAL = 0.1
+    TEMPLATE_CHECK_INTERVAL = 1
+    REMOTE = -1
+
+    def __init__(self, workers: int = 1, stats: MiningStats | None = None):
+        self.workers: int = max(0, workers)
+        self.stats: MiningStats | None = stats
+        self.jobs: Queue = Queue()
+        self.results: Queue = Queue()
+        self.stop: Event = Event()
+        self.processes: List[Process] = list()
+        self.started: bool = False
+
+        self.job_id: int = 0
+        self.job: Tuple[int, BlockHeader, Tx, List[bytes], int] | None = None
+        self.next_slot: int = self.workers
+
+    def start(self):
+        """Spin up worker processes"""
+        for _ in range(self.workers):
+            worker = Process(target=mining_worker, args=(self.jobs, self.results, self.stop), daemon=True)
+            worker.start()
+            self.processes.append(worker)
+        self.started = True
+        logger.info(f"Mining with {self.workers} worker(s)")
+
+    def shutdown(self):
+        """Stop worker processes"""
+        self.stop.set()
+        for _ in self.processes:
+            self.jobs.put(None)
+        for worker in self.processes:
+            worker.join(1)
+        self.processes.clear()
+        self.started = False
+
+    def allocate_slot(self) -> int:
+        """Extra nonce slot for external miner, slots are unique within current job"""
+        slot = self.next_slot
+        self.next_slot += 1
+        return slot
+
+    def mine(
+            self,
+            block_header: BlockHeader,
+            coinbase_tx: Tx,
+            branch: List[bytes],
+            target: int,
+            new_block_available,
+            template_updated: Callable[[], bool] | None = None
+    ) -> bool | None:
+        """
+        Find extra nonce, timestamp and nonce values that satisfy PoW rule
+        branch is coinbase merkle branch of the block.
+        On success header and coinbase are updated in place and False is returned.
+        Returns True if another miner was faster, None if template_updated() reported better template
+        """
+        if not self.started:
+            self.start()
+
+        self.job_id = (self.job_id + 1) & 0xFFFFFFFF
+        # solutions are checked against job id, so slots of previous jobs can be handed out again
+        self.next_slot = self.workers
+        self.stop.clear()
+        for slot in range(self.workers):
+            self.jobs.put((self.job_id, slot, block_header, coinbase_tx, branch, target))
+        self.job = (self.job_id, block_header, coinbase_tx, branch, target)
+
+        solution, competition_over = None, True
+        pending = self.workers
+        round_hashes = 0
+        round_start = template_checked = time.time()
+        while pending or not (solution or self.stop.is_set()):
+            try:
+                job_id, slot, result, hashes, elapsed = self.results.get(timeout=self.POLL_INTERVAL)
+            except Empty:
+                if self.stop.is_set():
+                    continue
+                if new_block_available:
+                    self.stop.set()
+                elif template_updated and time.time() - template_checked > self.TEMPLATE_CHECK_INTERVAL:
+                    template_checked = time.time()
+                    if template_updated():
+                        competition_over = None
+                        self.stop.set()
+                continue
+            if job_id != self.job_id:
+                continue
+            if slot != self.REMOTE:
+                pending -= 1
+                round_hashes += hashes
+                if self.stats:
+                    self.stats.record_worker(slot, hashes, elapsed)
+            if result is not None and solution is None:
+                solution = result
+                self.stop.set()
+        self.job = None
+        if self.stats:
+            self.stats.record_round(round_hashes, time.time() - round_start, solution is not None)
+
+        if solution is None:
+            return competition_over
+        apply_solution(block_header, coinbase_tx, branch, *solution)
+        block_header.blockHash = block_header.generateBlockHash()
+        return False
@@ -0,0 +1,121 @@
+from io import BytesIO
+from typing import List
+
+from pkg.src.core.blockheader import BlockHeader
+from pkg.src.core.tx import Tx
+from pkg.src.utils import encode_varint, read_varint, int_to_little_endian, little_endian_to_int
+
+
+class RequestMiningJob:
+    """Request mining job command"""
+    command = b'requestJob'
+
+    @staticmethod
+    def serialize() -> bytes:
+        return b""
+
+
+class RequestJobId:
+    """Request id of current mining job, lets miners poll for job change without fetching it"""
+    command = b'requestJobId'
+
+    @staticmethod
+    def serialize() -> bytes:
+        return b""
+
+
+class JobId:
+    """Id of current mining job"""
+    command = b'jobId'
+
+    def __init__(self, job_id: int):
+        self.job_id: int = job_id
+
+    @classmethod
+    def parse(cls, s: BytesIO) -> int:
+        return little_endian_to_int(s.read(4))
+
+    def serialize(self) -> bytes:
+        return int_to_little_endian(self.job_id, 4)
+
+
+class MiningJob:
+    """Block template with extra nonce slot for external miner"""
+    command = b'miningJob'
+
+    def __init__(
+            self,
+            job_id: int,
+            slot: int,
+            target: int,
+            block_header: BlockHeader,
+            coinbase_tx: Tx,
+            branch: List[bytes]
+    ):
+        self.job_id: int = job_id
+        self.slot: int = slot
+        self.target: int = target
+        self.block_header: BlockHeader = block_header
+        self.coinbase_tx: Tx = coinbase_tx
+        self.branch: List[bytes] = branch
+
+    @classmethod
+    def parse(cls, s: BytesIO) -> 'MiningJob':
+        job_id = little_endian_to_int(s.read(4))
+        slot = little_endian_to_int(s.read(4))
+        target = int.from_bytes(s.read(32), "big")
+        block_header = BlockHeader.parse(s)
+        coinbase_tx = Tx.parse(s)
+        branch = [s.read(32) for _ in range(read_varint(s))]
+        return cls(job_id, slot, target, block_header, coinbase_tx, branch)
+
+    def serialize(self) -> bytes:
+        result = int_to_little_endian(self.job_id, 4)
+        result += int_to_little_endian(self.slot, 4)
+        result += self.target.to_bytes(32, "big")
+        result += self.block_header.serialize()
+        result += self.coinbase_tx.serialize()
+        result += encode_varint(len(self.branch))
+        result += b"".join(self.branch)
+        return result
+
+
+class SubmitWork:
+    """Solution found by external miner"""
+    command = b'submitWork'
+
+    def __init__(self, job_id: int, extra_nonce: int, timestamp: int, nonce: int):
+        self.job_id: int = job_id
+        self.extra_nonce: int = extra_nonce
+        self.timestamp: int = timestamp
+        self.nonce: int = nonce
+
+    @classmethod
+    def parse(cls, s: BytesIO) -> 'SubmitWork':
+        job_id = little_endian_to_int(s.read(4))
+        extra_nonce = little_endian_to_int(s.read(8))
+        timestamp = little_endian_to_int(s.read(4))
+        nonce = little_endian_to_int(s.read(4))
+        return cls(job_id, extra_nonce, timestamp, nonce)
+
+    def serialize(self) -> bytes:
+        result = int_to_little_endian(self.job_id, 4)
+        result += int_to_little_endian(self.extra_nonce, 8)
+        result += int_to_little_endian(self.timestamp, 4)
+        result += int_to_little_endian(self.nonce, 4)
+        return result
+
+
+class WorkResult:
+    """Answer on submitted work"""
+    command = b'workResult'
+
+    def __init__(self, accepted: bool):
+        self.accepted: bool = accepted
+
+    @classmethod
+    def parse(cls, s: BytesIO) -> bool:
+        return s.read(1) == b'\x01'
+
+    def serialize(self) -> bytes:
+        return b'\x01' if self.accepted else b'\x00'
@@ -0,0 +1,97 @@
+import copy
+import time
+from socket import socket
+from threading import Thread
+
+from logger import init_logger
+from pkg.src.mining.miner import Miner, apply_solution
+from pkg.src.mining.protocol import RequestMiningJob, RequestJobId, JobId, MiningJob, SubmitWork, WorkResult
+from pkg.src.network.commands import FinishedSending
+from pkg.src.network.network import NetworkEnvelope
+from pkg.src.network.node import Node
+from pkg.src.utils import hash256, little_endian_to_int
+
+logger = init_logger("job_server")
+
+
+class JobServer:
+    """
+    Work distribution server for external miners
+    Hands out current Miner job with own extra nonce slot and accepts solved headers
+    """
+    MAX_FUTURE_TIME = 60
+
+    def __init__(self, host: str, port: int, miner: Miner):
+        self.host: str = host
+        self.port: int = port
+        self.miner: Miner = miner
+        self.server: Node = Node(host, port)
+
+    def start(self):
+        """Run server in other thread"""
+        Thread(target=self.spinUpTheServer, daemon=True).start()
+
+    def spinUpTheServer(self):
+        self.server.startServer()
+        logger.info(f"JOB SERVER LISTENING at {self.host}:{self.port}")
+        while True:
+            try:
+                conn, addr = self.server.acceptConnection()
+                self.handleConnection(conn)
+            except Exception as e:
+                logger.error(f"Error while processing miner request {e}")
+
+    def handleConnection(self, conn: socket):
+        """Miner requests handler"""
+        try:
+            envelope = self.server.read()
+            if envelope.command == RequestMiningJob.command:
+                self.sendJob(conn)
+            elif envelope.command == RequestJobId.command:
+                self.sendJobId(conn)
+            elif envelope.command == SubmitWork.command:
+                accepted = self.acceptWork(SubmitWork.parse(envelope.stream()))
+                self.send(conn, WorkResult(accepted))
+            else:
+                self.send(conn, FinishedSending())
+        finally:
+            conn.close()
+
+    @staticmethod
+    def send(conn: socket, message):
+        envelope = NetworkEnvelope(message.command, message.serialize())
+        conn.sendall(envelope.serialize())
+
+    def sendJob(self, conn: socket):
+        """Send current job or finished message if miner is idle"""
+        job = self.miner.job
+        if not job:
+            self.send(conn, FinishedSending())
+            return
+        job_id, block_header, coinbase_tx, branch, target = job
+        self.send(conn, MiningJob(job_id, self.miner.allocate_slot(), target, block_header, coinbase_tx, branch))
+
+    def sendJobId(self, conn: socket):
+        """Send id of current job or finished message if miner is idle, no extra nonce slot is used"""
+        job = self.miner.job
+        if not job:
+            self.send(conn, FinishedSending())
+            return
+        self.send(conn, JobId(job[0]))
+
+    def acceptWork(self, work: SubmitWork) -> bool:
+        """Check submitted solution and pass it to the miner"""
+        job = self.miner.job
+        if not job or job[0] != work.job_id:
+            return False
+        job_id, block_header, coinbase_tx, branch, target = job
+        if not block_header.timestamp <= work.timestamp <= time.time() + self.MAX_FUTURE_TIME:
+            return False
+
+        block_header, coinbase_tx = copy.deepcopy(block_header), copy.deepcopy(coinbase_tx)
+        apply_solution(block_header, coinbase_tx, branch, work.extra_nonce, work.timestamp, work.nonce)
+        if little_endian_to_int(hash256(block_header.serialize())) >= target:
+            return False
+        self.miner.results.put((job_id, Miner.REMOTE, (work.extra_nonce, work.timestamp, work.nonce), 0, 0))
+        logger.info(f"Accepted external solution for job {job_id} with Nonce value of {work.nonce}")
+        return True
@@ -0,0 +1,71 @@
+import time
+from multiprocessing.managers import DictProxy
+from typing import Dict
+
+
+class MiningStats:
+    """
+    Mining telemetry shared between blockchain process and API
+    Written only by the mining node, so read-modify-write of counters needs no lock
+    """
+    COUNTERS = (
+        "hashes", "stale_hashes", "rounds", "stale_rounds", "blocks_won", "blocks_lost", "total_time_to_solution"
+    )
+
+    def __init__(self, stats: DictProxy):
+        self.stats: DictProxy = stats
+        for counter in self.COUNTERS:
+            self.stats.setdefault(counter, 0)
+        self.stats.setdefault("workers", dict())
+        self.stats.setdefault("template_build_time", 0)
+        self.stats.setdefault("template_time", None)
+        self.stats.setdefault("time_to_solution", None)
+
+    def increment(self, counter: str, value: int | float = 1):
+        self.stats[counter] = self.stats[counter] + value
+
+    def record_template(self, build_time: float):
+        """Time spent on collecting transactions and building header of new template"""
+        self.stats.update(template_build_time=build_time, template_time=time.time())
+
+    def record_worker(self, slot: int, hashes: int, elapsed: float):
+        """Worker results of finished round, hashrate is measured per round"""
+        workers = self.stats["workers"]
+        worker = workers.get(slot, {"hashes": 0, "hashrate": 0})
+        worker["hashes"] += hashes
+        worker["hashrate"] = hashes / elapsed if elapsed else 0
+        workers[slot] = worker
+        self.stats["workers"] = workers
+
+    def record_round(self, hashes: int, elapsed: float, solved: bool):
+        """Round that was not solved by us (new block or better template) is counted as stale work"""
+        self.increment("rounds")
+        self.increment("hashes", hashes)
+        if solved:
+            self.stats["time_to_solution"] = elapsed
+            self.increment("total_time_to_solution", elapsed)
+        else:
+            self.increment("stale_rounds")
+            self.increment("stale_hashes", hashes)
+
+    def block_won(self):
+        self.increment("blocks_won")
+
+    def block_lost(self):
+        self.increment("blocks_lost")
+
+    def to_dict(self) -> Dict:
+        stats = dict(self.stats)
+        workers = stats.pop("workers")
+        template_time = stats.pop("template_time")
+        total_time_to_solution = stats.pop("total_time_to_solution")
+        stale_hashes = stats.pop("stale_hashes")
+        return {
+            **stats,
+            "hashrate": sum(worker["hashrate"] for worker in workers.values()),
+            "workers": {str(slot): worker for slot, worker in workers.items()},
+            "template_age": time.time() - template_time if template_time else None,
+            "avg_time_to_solution":
+                total_time_to_solution / stats["blocks_won"] if stats["blocks_won"] else None,
+            "stale_work_rate": stale_hashes / stats["hashes"] if stats["hashes"] else 0,
+        }
@@ -0,0 +1,199 @@
+import heapq
+from typing import Dict, List, Tuple
+
+from pkg.src.core.block import Block
+from pkg.src.core.eventbus import EventBus, Subscription
+from pkg.src.core.mempool import MemoryPool
+from pkg.src.core.tx import Tx
+from pkg.src.utils import MerkleTree
+
+COINBASE_PLACEHOLDER = b"\0" * 32
+
+
+class BlockTemplate:
+    """
+    Incrementally maintained set of transactions for the next block
+    Follows memory pool events, so new round costs O(changes) instead of O(memory pool)
+    Coinbase is always the first transaction (and merkle leaf) of the template
+    """
+    HEADER_SIZE = 80
+
+    def __init__(self, mem_pool: MemoryPool):
+        self.MemPool: MemoryPool = mem_pool
+        self.subscription: Subscription | None = None
+
+        self.txs: List[Tx | None] = [None]
+        self.ids: List[str] = [""]
+        self.tree: MerkleTree = MerkleTree([COINBASE_PLACEHOLDER])
+        self.positions: Dict[str, int] = dict()
+        self.candidates: Dict[str, Tx] = dict()
+        # Lazy heaps of (fee rate, TxId): selected cheapest first, candidates best first (negated rate)
+        # Entries of transactions that left template or candidates are skipped when popped
+        self.cheapest: List[Tuple[float, str]] = list()
+        self.best: List[Tuple[float, str]] = list()
+        self.spent: Dict[Tuple[bytes, int], str] = dict()
+        self.fee: int = 0
+        self.size: int = self.HEADER_SIZE
+
+    def reset(self):
+        """Drop template, it will be rebuilt from memory pool on next refresh"""
+        self.__init__(self.MemPool)
+
+    def refresh(self) -> bool:
+        """
+        Apply memory pool changes since last refresh
+        Returns True if template fee has grown
+        """
+        fee = self.fee
+        changes = self.subscription.poll() if self.subscription else None
+        if changes is None:
+            # Not built yet or missed events, rebuild from memory pool snapshot taken after subscribing
+            self.reset()
+            self.subscription = self.MemPool.events.subscribe(EventBus.TX_ADMITTED, EventBus.TX_REMOVED)
+            for tx in self.MemPool.to_dict().values():
+                self.admit(tx)
+            return self.fee > fee
+
+        for topic, tx_id in changes:
+            if topic == EventBus.TX_ADMITTED:
+                tx = self.MemPool.get(tx_id)
+                if tx:
+                    self.admit(tx)
+            else:
+                self.drop(tx_id)
+        return self.fee > fee
+
+    def connect_block(self, block: Block):
+        """Drop transactions spending same outputs as transactions of the connected block"""
+        for tx in block.Txs:
+            self.drop(tx.id())
+            for tx_in in tx.tx_ins:
+                tx_id = self.spent.get((tx_in.prev_tx, tx_in.prev_index))
+                if tx_id:
+                    self.drop(tx_id)
+                    self.MemPool.remove(tx_id)
+
+    @staticmethod
+    def fee_rate(tx: Tx) -> float:
+        return tx.fee / tx.size
+
+    def is_spendable(self, tx: Tx) -> bool:
+        """Check that all inputs are unspent and not used by selected transactions"""
+        for tx_in in tx.tx_ins:
+            if (tx_in.prev_tx, tx_in.prev_index) in self.spent:
+                return False
+            prev_tx = self.MemPool.UTXOs.get(tx_in.prev_tx.hex())
+            if not prev_tx or not prev_tx.tx_outs[tx_in.prev_index]:
+                return False
+        return True
+
+    def admit(self, tx: Tx):
+        """Add new memory pool transaction to template or candidates"""
+        tx_id = tx.id()
+        if tx_id in self.positions or tx_id in self.candidates:
+            return
+        if not self.is_spendable(tx):
+            self.MemPool.remove(tx_id)
+            return
+        tx.calculate_fee(self.MemPool.UTXOs)
+
+        if self.size + tx.size > MemoryPool.MAX_BLOCK_SIZE:
+            evicted = self.cheaper_than(tx)
+            if evicted is None:
+                self.add_candidate(tx_id, tx)
+                return
+            for evicted_id in evicted:
+                self.add_candidate(evicted_id, self.txs[self.positions[evicted_id]])
+                self.unselect(evicted_id)
+        self.select(tx_id, tx)
+
+    def cheaper_than(self, tx: Tx) -> List[str] | None:
+        """Lowest fee rate transactions to evict to fit tx, None if tx does not pay enough for that"""
+        rate = self.fee_rate(tx)
+        evicted, popped = list(), set()
+        free = MemoryPool.MAX_BLOCK_SIZE - self.size
+        while free < tx.size and self.cheapest:
+            entry = heapq.heappop(self.cheapest)
+            if entry[1] not in self.positions or entry in popped:
+                continue
+            popped.add(entry)
+            if entry[0] >= rate:
+                break
+            evicted.append(entry[1])
+            free += self.txs[self.positions[entry[1]]].size
+        for entry in popped:
+            heapq.heappush(self.cheapest, entry)
+        return evicted if free >= tx.size else None
+
+    def drop(self, tx_id: str):
+        """Remove transaction from template and fill freed space with best candidates"""
+        if self.candidates.pop(tx_id, None) or tx_id not in self.positions:
+            return
+        self.unselect(tx_id)
+        while self.best:
+            entry = heapq.heappop(self.best)
+            tx = self.candidates.get(entry[1])
+            if tx is None:
+                continue
+            if self.size + tx.size > MemoryPool.MAX_BLOCK_SIZE:
+                heapq.heappush(self.best, entry)
+                return
+            tx_id = entry[1]
+            del self.candidates[tx_id]
+            if self.is_spendable(tx):
+                self.select(tx_id, tx)
+            else:
+                self.MemPool.remove(tx_id)
+
+    def add_candidate(self, tx_id: str, tx: Tx):
+        self.candidates[tx_id] = tx
+        heapq.heappush(self.best, (-self.fee_rate(tx), tx_id))
+        if len(self.best) > 2 * len(self.candidates) + 64:
+            self.best = list(set(entry for entry in self.best if entry[1] in self.candidates))
+            heapq.heapify(self.best)
+
+    def select(self, tx_id: str, tx: Tx):
+        self.positions[tx_id] = len(self.txs)
+        self.txs.append(tx)
+        self.ids.append(tx_id)
+        self.tree.append(bytes.fromhex(tx_id))
+        heapq.heappush(self.cheapest, (self.fee_rate(tx), tx_id))
+        if len(self.cheapest) > 2 * len(self.positions) + 64:
+            self.cheapest = list(set(entry for entry in self.cheapest if entry[1] in self.positions))
+            heapq.heapify(self.cheapest)
+        for tx_in in tx.tx_ins:
+            self.spent[(tx_in.prev_tx, tx_in.prev_index)] = tx_id
+        self.fee += tx.fee
+        self.size += tx.size
+
+    def unselect(self, tx_id: str):
+        index = self.positions.pop(tx_id)
+        tx = self.txs[index]
+        last, last_id = self.txs.pop(), self.ids.pop()
+        if index < len(self.txs):
+            self.txs[index], self.ids[index] = last, last_id
+            self.positions[last_id] = index
+        self.tree.remove(index)
+        for tx_in in tx.tx_ins:
+            self.spent.pop((tx_in.prev_tx, tx_in.prev_index), None)
+        self.fee -= tx.fee
+        self.size -= tx.size
+
+    def set_coinbase(self, coinbase_tx: Tx):
+        self.txs[0] = coinbase_tx
+        self.tree.replace(0, coinbase_tx.hash())
+
+    def transactions(self) -> List[Tx]:
+        """Snapshot of block transactions, coinbase first"""
+        return list(self.txs)
+
+    def tx_ids(self) -> List[bytes]:
+        """Snapshot of merkle leaves, coinbase first"""
+        return self.tree.leaves()
+
+    def merkle_root(self) -> bytes:
+        return self.tree.root()
+
+    def merkle_branch(self) -> List[bytes]:
+        """Coinbase merkle branch, enough to recalculate root after extra nonce change"""
+        return self.tree.branch()
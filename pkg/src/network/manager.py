@@ -67,7 +67,7 @@ class SyncManager:
                 self.addNode()
 
             if envelope.command == Tx.command:
-                transaction = Tx.parse(envelope.stream())
+                transaction, _ = Tx.parse_buffer(envelope.payload)
                 transaction.TxId = transaction.id()
                 try:
                     self.memory_pool.add(transaction)
@@ -75,7 +75,7 @@ class SyncManager:
                     logger.info(f"Incorrect transaction {e}")
 
             elif envelope.command == Block.command:
-                block = Block.parse(envelope.stream())
+                block, _ = Block.parse_buffer(envelope.payload)
                 try:
                     self.newBlockAvailable.add(block)
                     logger.info(f"New Block Received : {block.Height}")
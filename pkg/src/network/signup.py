@@ -92,16 +92,18 @@ class SignUpNode:
         while True:
             envelope = NetworkEnvelope.parse(publisher.stream)
             if envelope.command == Tx.command:
-                transaction = Tx.parse(envelope.stream())
+                try:
+                    transaction, _ = Tx.parse_buffer(envelope.payload)
+                except Exception as e:
+                    logger.warning(f"Incorrect transaction {e}")
+                    continue
                 transaction.TxId = transaction.id()
                 temp_mem_pool.append(transaction)
             if envelope.command == FinishedSending.command:
                 break
-        for transaction in temp_mem_pool:
-            try:
-                self.memoryPool.add(transaction)
-            except Exception as e:
-                logger.warning(f"Incorrect transaction {e}")
+        for error in self.memoryPool.add_txs(temp_mem_pool):
+            if error:
+                logger.warning(f"Incorrect transaction {error}")
         publisher.close()
 
     def downloadSecondaryChain(self):
@@ -112,7 +114,7 @@ class SignUpNode:
         while True:
             envelope = NetworkEnvelope.parse(publisher.stream)
             if envelope.command == Block.command:
-                block = Block.parse(envelope.stream())
+                block, _ = Block.parse_buffer(envelope.payload)
                 self.secondaryChain.add(block)
             if envelope.command == FinishedSending.command:
                 break
@@ -146,8 +148,11 @@ class SignUpNode:
             while True:
                 envelope = NetworkEnvelope.parse(publisher.stream)
                 if envelope.command == Block.command:
-                    block = Block.parse(envelope.stream())
+                    block, _ = Block.parse_buffer(envelope.payload)
                     if block.validateBlock(last_block):
+                        if not self.verifyBlock(block):
+                            logger.warning(f"INVALID SIGNATURES IN BLOCK {block.Height}")
+                            break
                         for idx, tx in enumerate(block.Txs):
                             tx.TxId = tx.id()
                             block.Txs[idx] = tx
@@ -168,6 +173,20 @@ class SignUpNode:
         finally:
             publisher.close()
 
+    def verifyBlock(self, block: Block) -> bool:
+        """Check signatures of downloaded block against outputs of saved and same block transactions"""
+        block_txs = {tx.id(): tx for tx in block.Txs}
+        inputs = list()
+        for tx in block.Txs:
+            if tx.is_coinbase():
+                continue
+            for index, tx_in in enumerate(tx.tx_ins):
+                prev_tx = block_txs.get(tx_in.prev_tx.hex()) or self.db.find_transaction(tx_in.prev_tx.hex())
+                if not prev_tx or tx_in.prev_index >= len(prev_tx.tx_outs) or not prev_tx.tx_outs[tx_in.prev_index]:
+                    return False
+                inputs.append((tx, index, prev_tx.tx_outs[tx_in.prev_index].script_pubkey))
+        return all(self.memoryPool.verifier.verify_inputs(inputs))
+
     def sync(self):
         """Run downloading latest blockchain data"""
         if len(self.nodes) < 1:
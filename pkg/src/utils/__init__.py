@@ -2,7 +2,7 @@ from .base58 import Base58Utils
 from .bits import TargetUtils
 from .byte import ByteUtils
 from .hash import HashUtils
-from .merkle_root import MerkleUtils
+from .merkle_root import MerkleUtils, MerkleTree
 from .varint import VarIntUtils
 
 __all__ = [
@@ -11,6 +11,7 @@ __all__ = [
     "Base58Utils",
     "VarIntUtils",
     "MerkleUtils",
+    "MerkleTree",
     "TargetUtils",
     "hash256",
     "hash160",
@@ -19,10 +20,13 @@ __all__ = [
     "little_endian_to_int",
     "encode_varint",
     "read_varint",
+    "read_varint_buffer",
     "encode_base58",
     "decode_base58",
     "encode_base58_checksum",
     "merkle_root",
+    "merkle_branch",
+    "merkle_root_from_branch",
     "target_to_bits",
     "bits_to_target",
     "get_target_and_timestamp",
@@ -43,8 +47,11 @@ encode_base58_checksum = Base58Utils.encode_checksum
 
 encode_varint = VarIntUtils.encode
 read_varint = VarIntUtils.decode
+read_varint_buffer = VarIntUtils.decode_buffer
 
 merkle_root = MerkleUtils.merkle_root
+merkle_branch = MerkleUtils.merkle_branch
+merkle_root_from_branch = MerkleUtils.merkle_root_from_branch
 
 target_to_bits = TargetUtils.target_to_bits
 bits_to_target = TargetUtils.bits_to_target
@@ -1,6 +1,3 @@
-from math import log
-
-
 class ByteUtils:
     """Utility class for working with bytes and integers."""
 
@@ -9,7 +6,7 @@ class ByteUtils:
         """Calculates the minimum number of bytes needed to represent a number."""
         if number < 0:
             raise ValueError("Number must be non-negative")
-        return 1 if number == 0 else int(log(number, 256)) + 1
+        return 1 if number == 0 else (number.bit_length() + 7) // 8
 
     @staticmethod
     def int_to_little_endian(number: int, length: int) -> bytes:
@@ -24,3 +24,87 @@ class MerkleUtils:
         while len(current_level) > 1:
             current_level = MerkleUtils.merkle_parent_level(current_level)
         return current_level[0]
+
+    @staticmethod
+    def merkle_branch(hashes: List[bytes]) -> List[bytes]:
+        """Computes sibling hashes on the path from the first leaf to the Merkle root."""
+        branch = []
+        current_level = list(hashes)
+        while len(current_level) > 1:
+            branch.append(current_level[1])
+            current_level = MerkleUtils.merkle_parent_level(current_level)
+        return branch
+
+    @staticmethod
+    def merkle_root_from_branch(leaf: bytes, branch: List[bytes]) -> bytes:
+        """Computes the Merkle root from the first leaf and its branch."""
+        current = leaf
+        for sibling in branch:
+            current = HashUtils.hash256(current + sibling)
+        return current
+
+
+class MerkleTree:
+    """
+    Merkle tree that keeps every level
+    Changing a leaf recalculates only hashes on its path to the root
+    """
+
+    def __init__(self, leaves: List[bytes] | None = None):
+        self.levels: List[List[bytes]] = [list(leaves or [])]
+        current_level = self.levels[0]
+        while len(current_level) > 1:
+            current_level = MerkleUtils.merkle_parent_level(list(current_level))
+            self.levels.append(current_level)
+
+    def __len__(self) -> int:
+        return len(self.levels[0])
+
+    def leaves(self) -> List[bytes]:
+        """Copy of tree leaves"""
+        return list(self.levels[0])
+
+    def root(self) -> bytes:
+        """Merkle root, same as MerkleUtils.merkle_root over the leaves"""
+        return self.levels[-1][0]
+
+    def branch(self) -> List[bytes]:
+        """Sibling hashes on the path from the first leaf to the root"""
+        return [level[1] for level in self.levels[:-1]]
+
+    def append(self, leaf: bytes):
+        self.levels[0].append(leaf)
+        self.update_path(len(self) - 1)
+
+    def replace(self, index: int, leaf: bytes):
+        self.levels[0][index] = leaf
+        self.update_path(index)
+
+    def remove(self, index: int):
+        """Remove leaf, last leaf takes its place"""
+        last = self.levels[0].pop()
+        if index < len(self):
+            self.levels[0][index] = last
+            self.update_path(index)
+        if self:
+            self.update_path(len(self) - 1)
+
+    def update_path(self, index: int):
+        """Recalculate parents of the leaf with given index up to the root"""
+        depth = 0
+        while len(self.levels[depth]) > 1:
+            level = self.levels[depth]
+            if depth + 1 == len(self.levels):
+                self.levels.append([])
+            parent_level = self.levels[depth + 1]
+            del parent_level[(len(level) + 1) // 2:]
+
+            index //= 2
+            left = level[2 * index]
+            right = level[2 * index + 1] if 2 * index + 1 < len(level) else left
+            if index == len(parent_level):
+                parent_level.append(HashUtils.hash256(left + right))
+            else:
+                parent_level[index] = HashUtils.hash256(left + right)
+            depth += 1
+        del self.levels[depth + 1:]
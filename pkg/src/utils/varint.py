@@ -1,4 +1,5 @@
 from socket import SocketIO
+from typing import Tuple
 
 from pkg.src.utils.byte import ByteUtils
 
@@ -30,3 +31,22 @@ class VarIntUtils:
         elif prefix == 0xff:
             return ByteUtils.little_endian_to_int(stream.read(8))
         return prefix
+
+    @staticmethod
+    def decode_buffer(buffer: memoryview | bytes, offset: int) -> Tuple[int, int]:
+        """
+        Reads a variable-length integer at offset of a buffer, returns it with offset past it.
+        Only the shortest encoding is accepted, so raw bytes match what encode() gives back.
+        """
+        prefix = buffer[offset]
+        if prefix == 0xfd:
+            number, size, minimum = ByteUtils.little_endian_to_int(buffer[offset + 1:offset + 3]), 3, 0xfd
+        elif prefix == 0xfe:
+            number, size, minimum = ByteUtils.little_endian_to_int(buffer[offset + 1:offset + 5]), 5, 0x10000
+        elif prefix == 0xff:
+            number, size, minimum = ByteUtils.little_endian_to_int(buffer[offset + 1:offset + 9]), 9, 0x100000000
+        else:
+            return prefix, offset + 1
+        if number < minimum:
+            raise ValueError(f"Non-canonical varint: {number}")
+        return number, offset + size
@@ -0,0 +1,26 @@
+"""
+Int-native secp256k1 affine helpers
+
+FieldElement checks primes and range on every operation and allocates new object per result.
+Sha256Point hot paths (construction, SEC parsing) use these raw int functions mod P instead,
+jacobian module does the same for scalar multiplication.
+"""
+from pkg.src.wallet.constants import B, P
+
+SQRT_EXPONENT = (P + 1) // 4
+
+
+def is_on_curve(x: int, y: int) -> bool:
+    """y^2 == x^3 + 7 with coordinates in field range"""
+    return 0 <= x < P and 0 <= y < P and (y * y - x * x * x - B) % P == 0
+
+
+def lift_x(x: int, odd: bool) -> int | None:
+    """y coordinate with given parity for x, None if x is not on the curve"""
+    if not 0 <= x < P:
+        return None
+    alpha = (x * x * x + B) % P
+    beta = pow(alpha, SQRT_EXPONENT, P)
+    if beta * beta % P != alpha:
+        return None
+    return beta if beta & 1 == odd else P - beta
@@ -0,0 +1,226 @@
+"""
+Jacobian coordinates for secp256k1 scalar multiplication
+
+Point (X, Y, Z) stands for affine (X / Z^2, Y / Z^3), Z == 0 is the point at infinity.
+Additions and doublings need no modular inversion, so scalar multiplication
+does a single inversion when converting result back to affine coordinates.
+Works on raw ints mod P, Sha256Point stays the public API.
+"""
+from typing import List, Tuple
+
+from pkg.src.wallet.constants import N, P
+
+JacobianPoint = Tuple[int, int, int]
+
+INFINITY: JacobianPoint = (0, 1, 0)
+
+# GLV endomorphism of secp256k1: LAMBDA * (x, y) == (BETA * x, y)
+BETA = 0x7AE96A2B657C07106E64479EAC3434E99CF0497512F58995C1396C28719501EE
+LAMBDA = 0x5363AD4CC05C30E0A5261C028812645A122E22EA20816678DF02967C1B23BD72
+# Short basis of the lattice {(a, b): a + b * LAMBDA == 0 mod N}
+GLV_A1 = 0x3086D221A7D46BCDE86C90E49284EB15
+GLV_B1 = -0xE4437ED6010E88286F547FA90ABFE4C3
+GLV_A2 = 0x114CA50F7A8E2F3F657C1108D9D44CFD8
+GLV_B2 = GLV_A1
+
+
+def from_affine(x: int, y: int) -> JacobianPoint:
+    return x, y, 1
+
+
+def to_affine(point: JacobianPoint) -> Tuple[int, int] | None:
+    """Affine (x, y), None for the point at infinity"""
+    x, y, z = point
+    if not z:
+        return None
+    z_inv = pow(z, -1, P)
+    z_inv2 = z_inv * z_inv % P
+    return x * z_inv2 % P, y * z_inv2 * z_inv % P
+
+
+def batch_to_affine(points: List[JacobianPoint]) -> List[Tuple[int, int]]:
+    """Convert finite points with one shared inversion (Montgomery trick)"""
+    prefixes, acc = list(), 1
+    for _, _, z in points:
+        prefixes.append(acc)
+        acc = acc * z % P
+    inv = pow(acc, -1, P)
+    result = [None] * len(points)
+    for index in range(len(points) - 1, -1, -1):
+        x, y, z = points[index]
+        z_inv = inv * prefixes[index] % P
+        inv = inv * z % P
+        z_inv2 = z_inv * z_inv % P
+        result[index] = (x * z_inv2 % P, y * z_inv2 * z_inv % P)
+    return result
+
+
+def batch_add(points: List[Tuple[int, int]], addends: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    Pairwise affine sums with one shared inversion (Montgomery trick) for all slopes
+    Points must be finite and have x different from x of their addends
+    """
+    prefixes, acc = list(), 1
+    for (x1, _), (x2, _) in zip(points, addends):
+        prefixes.append(acc)
+        acc = acc * (x2 - x1) % P
+    inv = pow(acc, -1, P)
+    result = [None] * len(points)
+    for index in range(len(points) - 1, -1, -1):
+        x1, y1 = points[index]
+        x2, y2 = addends[index]
+        dx_inv = inv * prefixes[index] % P
+        inv = inv * (x2 - x1) % P
+        slope = (y2 - y1) * dx_inv % P
+        x3 = (slope * slope - x1 - x2) % P
+        result[index] = (x3, (slope * (x1 - x3) - y1) % P)
+    return result
+
+
+def has_x(point: JacobianPoint, x: int) -> bool:
+    """Check affine x coordinate without inversion"""
+    return point[2] != 0 and (point[0] - x * point[2] * point[2]) % P == 0
+
+
+def double(point: JacobianPoint) -> JacobianPoint:
+    """dbl-2009-l formulas for a = 0"""
+    x, y, z = point
+    if not z or not y:
+        return INFINITY
+    a = x * x % P
+    b = y * y % P
+    c = b * b % P
+    d = 2 * ((x + b) ** 2 - a - c) % P
+    e = 3 * a % P
+    x3 = (e * e - 2 * d) % P
+    y3 = (e * (d - x3) - 8 * c) % P
+    z3 = 2 * y * z % P
+    return x3, y3, z3
+
+
+def add(p1: JacobianPoint, p2: JacobianPoint) -> JacobianPoint:
+    x1, y1, z1 = p1
+    x2, y2, z2 = p2
+    if not z1:
+        return p2
+    if not z2:
+        return p1
+    z1z1 = z1 * z1 % P
+    z2z2 = z2 * z2 % P
+    u1 = x1 * z2z2 % P
+    u2 = x2 * z1z1 % P
+    s1 = y1 * z2 * z2z2 % P
+    s2 = y2 * z1 * z1z1 % P
+    if u1 == u2:
+        return double(p1) if s1 == s2 else INFINITY
+    h = u2 - u1
+    r = s2 - s1
+    hh = h * h % P
+    hhh = h * hh % P
+    v = u1 * hh % P
+    x3 = (r * r - hhh - 2 * v) % P
+    y3 = (r * (v - x3) - s1 * hhh) % P
+    z3 = h * z1 * z2 % P
+    return x3, y3, z3
+
+
+def add_affine(p1: JacobianPoint, x2: int, y2: int) -> JacobianPoint:
+    """Mixed addition of affine point (Z2 == 1), saves a few multiplications"""
+    x1, y1, z1 = p1
+    if not z1:
+        return x2, y2, 1
+    z1z1 = z1 * z1 % P
+    u2 = x2 * z1z1 % P
+    s2 = y2 * z1 * z1z1 % P
+    if x1 == u2:
+        return double(p1) if y1 == s2 else INFINITY
+    h = u2 - x1
+    r = s2 - y1
+    hh = h * h % P
+    hhh = h * hh % P
+    v = x1 * hh % P
+    x3 = (r * r - hhh - 2 * v) % P
+    y3 = (r * (v - x3) - y1 * hhh) % P
+    z3 = h * z1 % P
+    return x3, y3, z3
+
+
+def multiply(x: int, y: int, scalar: int) -> JacobianPoint:
+    """Left-to-right double-and-add of affine point by non-negative scalar"""
+    result = INFINITY
+    for bit in bin(scalar)[2:]:
+        result = double(result)
+        if bit == "1":
+            result = add_affine(result, x, y)
+    return result
+
+
+def wnaf(scalar: int, width: int) -> List[int]:
+    """Width-w non-adjacent form, least significant digit first, non-zero digits are odd"""
+    digits = list()
+    while scalar:
+        if scalar & 1:
+            digit = scalar & ((1 << width) - 1)
+            if digit >= 1 << (width - 1):
+                digit -= 1 << width
+            scalar -= digit
+        else:
+            digit = 0
+        digits.append(digit)
+        scalar >>= 1
+    return digits
+
+
+def odd_multiples(x: int, y: int, width: int) -> List[Tuple[int, int]]:
+    """Affine P, 3P, 5P, ... (2^(w-1) - 1)P, the table for wnaf digits of given width"""
+    point = from_affine(x, y)
+    twice = double(point)
+    multiples = [point]
+    for _ in range((1 << (width - 2)) - 1):
+        multiples.append(add(multiples[-1], twice))
+    return batch_to_affine(multiples)
+
+
+def multi_multiply(terms: List[Tuple[int, List[Tuple[int, int]], int]]) -> JacobianPoint:
+    """
+    Sum of scalar * point over (scalar, odd multiples of point, width) terms, scalars may be negative
+    Interleaved wNAF (Strauss/Shamir trick): all terms share one doubling chain
+    """
+    nafs = list()
+    for scalar, multiples, width in terms:
+        naf = wnaf(abs(scalar), width)
+        nafs.append(([-digit for digit in naf] if scalar < 0 else naf, multiples))
+    result = INFINITY
+    for index in range(max((len(naf) for naf, _ in nafs), default=0) - 1, -1, -1):
+        result = double(result)
+        for naf, multiples in nafs:
+            if index < len(naf) and naf[index]:
+                digit = naf[index]
+                x, y = multiples[abs(digit) >> 1]
+                result = add_affine(result, x, y if digit > 0 else P - y)
+    return result
+
+
+def glv_split(scalar: int) -> Tuple[int, int]:
+    """Split scalar into k1 + k2 * LAMBDA == scalar mod N with |k1|, |k2| around 128 bits"""
+    c1 = (GLV_B2 * scalar + N // 2) // N
+    c2 = (-GLV_B1 * scalar + N // 2) // N
+    k1 = scalar - c1 * GLV_A1 - c2 * GLV_A2
+    k2 = -c1 * GLV_B1 - c2 * GLV_B2
+    return k1, k2
+
+
+def endomorphism(multiples: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Odd multiples of LAMBDA * point from odd multiples of point"""
+    return [(BETA * x % P, y) for x, y in multiples]
+
+
+def glv_terms(
+        scalar: int,
+        multiples: List[Tuple[int, int]],
+        lambda_multiples: List[Tuple[int, int]],
+        width: int
+) -> List[Tuple[int, List[Tuple[int, int]], int]]:
+    """multi_multiply terms for scalar * point, halving length of the doubling chain"""
+    k1, k2 = glv_split(scalar)
+    return [(k1, multiples, width), (k2, lambda_multiples, width)]
@@ -60,15 +60,32 @@ class OPCode:
         sec_pubkey = stack.pop()
         der_signature = stack.pop()[:-1]
 
+        if OPCode.check_signature(z, sec_pubkey, der_signature):
+            stack.append(1)
+            return True
+        else:
+            stack.append(0)
+            return False
+
+    @staticmethod
+    def check_signature(z, sec_pubkey, der_signature):
+        """Verify DER signature of z against SEC pubkey"""
         try:
             point = Sha256Point.parse(sec_pubkey)
             sig = Signature.parse(der_signature)
         except Exception as e:
             return False
 
-        if point.verify(z, sig):
-            stack.append(1)
-            return True
-        else:
-            stack.append(0)
+        return point.verify(z, sig)
+
+    @staticmethod
+    def op_check_sig_deferred(stack, z, checks):
+        """Collect (z, SEC pubkey, DER signature) for batch verification and assume signature is valid"""
+        if len(stack) < 2:
             return False
+
+        sec_pubkey = stack.pop()
+        der_signature = stack.pop()[:-1]
+        checks.append((z, sec_pubkey, der_signature))
+        stack.append(1)
+        return True
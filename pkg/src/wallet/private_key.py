@@ -1,8 +1,10 @@
 import hashlib
 import hmac
+from typing import List
 
 from pkg.src.wallet.constants import N
-from pkg.src.wallet.sha256point import G
+from pkg.src.wallet import jacobian
+from pkg.src.wallet.sha256point import G, batch_multiply_g, multiply_g
 from pkg.src.wallet.signature import Signature
 
 
@@ -11,12 +13,27 @@ class PrivateKey:
         self.secret = secret
         self.point = secret * G  # <1>
 
+    @classmethod
+    def batch(cls, secrets: List[int]) -> List["PrivateKey"]:
+        """Keys for many secrets at once, public points share fixed-base table and one inversion"""
+        keys = list()
+        for secret, point in zip(secrets, batch_multiply_g(secrets)):
+            key = cls.__new__(cls)
+            key.secret, key.point = secret, point
+            keys.append(key)
+        return keys
+
+    @classmethod
+    def batch_addresses(cls, secrets: List[int], compressed=True) -> List[str]:
+        """Addresses for many secrets at once"""
+        return [key.point.address(compressed) for key in cls.batch(secrets)]
+
     def hex(self):
         return "{:x}".format(self.secret).zfill(64)
 
     def sign(self, z):
         k = self.deterministic_k(z)  # <1>
-        r = (k * G).x.num
+        r, _ = jacobian.to_affine(multiply_g(k))
         k_inv = pow(k, N - 2, N)
         s = (z + r * self.secret) * k_inv % N
         if s > N / 2:
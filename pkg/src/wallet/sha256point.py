@@ -1,16 +1,41 @@
+from functools import lru_cache
+from typing import List, Tuple
+
 from pkg.src.utils import hash160, encode_base58_checksum
-from pkg.src.wallet.constants import A, B, N, P
+from pkg.src.wallet import curve, jacobian
+from pkg.src.wallet.constants import A, B, N
 from pkg.src.wallet.point import Point
 from pkg.src.wallet.sha256field import Sha256Field
 
 
 class Sha256Point(Point):
     def __init__(self, x, y, a=None, b=None):
-        a, b = Sha256Field(A), Sha256Field(B)
+        # Curve check on ints instead of FieldElement arithmetic of Point.__init__
+        self.a, self.b = CURVE_A, CURVE_B
+        self.x, self.y = x, y
+        self.tables = None
+        if x is None and y is None:
+            return
         if type(x) == int:
-            super().__init__(x=Sha256Field(x), y=Sha256Field(y), a=a, b=b)
-        else:
-            super().__init__(x=x, y=y, a=a, b=b)  # <1>
+            self.x, self.y = Sha256Field(x), Sha256Field(y)
+        if not curve.is_on_curve(self.x.num, self.y.num):
+            raise ValueError("({}, {}) is not on the curve".format(x, y))  # <1>
+
+    @classmethod
+    def from_ints(cls, x: int, y: int) -> "Sha256Point":
+        """Point from result of curve arithmetic, skips curve check"""
+        point = cls.__new__(cls)
+        point.a, point.b = CURVE_A, CURVE_B
+        point.x, point.y = Sha256Field(x), Sha256Field(y)
+        point.tables = None
+        return point
+
+    def wnaf_tables(self) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+        """Odd multiples of point and of its endomorphism image, kept for repeat multiplications"""
+        if self.tables is None:
+            multiples = jacobian.odd_multiples(self.x.num, self.y.num, VERIFY_WNAF_WIDTH)
+            self.tables = (multiples, jacobian.endomorphism(multiples))
+        return self.tables
 
     # end::source7[]
 
@@ -23,7 +48,17 @@ class Sha256Point(Point):
     # tag::source8[]
     def __rmul__(self, coefficient):
         coef = coefficient % N  # <1>
-        return super().__rmul__(coef)
+        if self.x is None:
+            return self
+        if self.x.num == G.x.num and self.y.num == G.y.num:
+            result = jacobian.to_affine(multiply_g(coef))
+        else:
+            result = jacobian.to_affine(jacobian.multi_multiply(
+                jacobian.glv_terms(coef, *self.wnaf_tables(), VERIFY_WNAF_WIDTH)
+            ))
+        if result is None:
+            return self.__class__(None, None)
+        return self.from_ints(*result)
 
     # end::source8[]
 
@@ -32,8 +67,12 @@ class Sha256Point(Point):
         s_inv = pow(sig.s, N - 2, N)  # <1>
         u = z * s_inv % N  # <2>
         v = sig.r * s_inv % N  # <3>
-        total = u * G + v * self  # <4>
-        return total.x.num == sig.r  # <5>
+        # u * G + v * self in one doubling chain, both split with GLV endomorphism  # <4>
+        total = jacobian.multi_multiply(
+            jacobian.glv_terms(u, g_odd_multiples(), g_lambda_odd_multiples(), G_WNAF_WIDTH)
+            + jacobian.glv_terms(v, *self.wnaf_tables(), VERIFY_WNAF_WIDTH)
+        )
+        return jacobian.has_x(total, sig.r)  # <5>
 
     # end::source12[]
     def sec(self, compressed=True):
@@ -58,30 +97,126 @@ class Sha256Point(Point):
 
     @classmethod
     def parse(cls, sec_bin):
-        """returns a Point object from a SEC binary (not hex)"""
-        if sec_bin[0] == 4:  # <1>
-            x = int.from_bytes(sec_bin[1:33], "big")
-            y = int.from_bytes(sec_bin[33:65], "big")
-            return Sha256Point(x=x, y=y)
-        is_even = sec_bin[0] == 2  # <2>
-        x = Sha256Field(int.from_bytes(sec_bin[1:], "big"))
-        # right side of the equation y^2 = x^3 + 7
-        alpha = x ** 3 + Sha256Field(B)
-        # solve for left side
-        beta = alpha.sqrt()  # <3>
-        if beta.num % 2 == 0:  # <4>
-            even_beta = beta
-            odd_beta = Sha256Field(P - beta.num)
-        else:
-            even_beta = Sha256Field(P - beta.num)
-            odd_beta = beta
-        if is_even:
-            return Sha256Point(x, even_beta)
-        else:
-            return Sha256Point(x, odd_beta)
+        """
+        returns a Point object from a SEC binary (not hex)
+        Recently parsed keys (with their wNAF tables) come from cache, returned points must not be modified
+        """
+        return parse_sec(bytes(sec_bin))
+
+
+# Busy wallets sign with the same few keys over and over, parsed points are cached by SEC bytes
+PARSE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_sec(sec_bin: bytes) -> Sha256Point:
+    """Uncached Sha256Point.parse"""
+    if sec_bin[0] == 4:  # <1>
+        x = int.from_bytes(sec_bin[1:33], "big")
+        y = int.from_bytes(sec_bin[33:65], "big")
+        return Sha256Point(x=x, y=y)
+    is_even = sec_bin[0] == 2  # <2>
+    x = int.from_bytes(sec_bin[1:], "big")
+    # solve y^2 = x^3 + 7 for y of required parity
+    y = curve.lift_x(x, not is_even)  # <3>
+    if y is None:
+        raise ValueError("({}, None) is not on the curve".format(x))
+    return Sha256Point.from_ints(x, y)
+
 
+CURVE_A, CURVE_B = Sha256Field(A), Sha256Field(B)
 
 G = Sha256Point(
     0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
     0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8,
 )
+
+# Fixed-base table for G: G_TABLE[i][d] = d * 2^(G_WINDOW * i) * G in affine coordinates
+# Built on first use, after that k * G is at most 64 mixed additions without doublings
+G_WINDOW = 4
+G_TABLE: List[List[Tuple[int, int] | None]] | None = None
+
+
+def g_table() -> List[List[Tuple[int, int] | None]]:
+    global G_TABLE
+    if G_TABLE is None:
+        points = list()
+        base = jacobian.from_affine(G.x.num, G.y.num)
+        for _ in range(-(-N.bit_length() // G_WINDOW)):
+            current = base
+            for _ in range(1, 1 << G_WINDOW):
+                points.append(current)
+                current = jacobian.add(current, base)
+            base = current
+        points = jacobian.batch_to_affine(points)
+        row_size = (1 << G_WINDOW) - 1
+        G_TABLE = [[None] + points[i:i + row_size] for i in range(0, len(points), row_size)]
+    return G_TABLE
+
+
+def multiply_g(scalar: int) -> jacobian.JacobianPoint:
+    """scalar * G with precomputed table, scalar must be in range 0 to N - 1"""
+    table = g_table()
+    mask = (1 << G_WINDOW) - 1
+    result = jacobian.INFINITY
+    for row in table:
+        digit = scalar & mask
+        if digit:
+            result = jacobian.add_affine(result, *row[digit])
+        scalar >>= G_WINDOW
+    return result
+
+
+def batch_multiply_g(scalars: List[int]) -> List[Sha256Point]:
+    """
+    scalar * G for many scalars, walks the fixed-base table row by row for all of them
+    Affine additions of a row share one inversion, so there is no per-point conversion at the end
+    """
+    table = g_table()
+    mask = (1 << G_WINDOW) - 1
+    scalars = [scalar % N for scalar in scalars]
+    results: List[Tuple[int, int] | None] = [None] * len(scalars)
+    shift = 0
+    for row in table:
+        indexes, points, addends = list(), list(), list()
+        for index, scalar in enumerate(scalars):
+            digit = (scalar >> shift) & mask
+            if not digit:
+                continue
+            addend, point = row[digit], results[index]
+            if point is None:
+                results[index] = addend
+            elif point[0] == addend[0]:
+                # doubling or opposite point, practically never happens for random scalars
+                results[index] = jacobian.to_affine(jacobian.add_affine(jacobian.from_affine(*point), *addend))
+            else:
+                indexes.append(index)
+                points.append(point)
+                addends.append(addend)
+        if indexes:
+            for index, point in zip(indexes, jacobian.batch_add(points, addends)):
+                results[index] = point
+        shift += G_WINDOW
+    return [Sha256Point(None, None) if point is None else Sha256Point.from_ints(*point) for point in results]
+
+
+# Odd multiples of G for wNAF digits in verify, wider window than for arbitrary public keys
+# since the table is built only once
+G_WNAF_WIDTH = 8
+VERIFY_WNAF_WIDTH = 5
+G_ODD_MULTIPLES: List[Tuple[int, int]] | None = None
+G_LAMBDA_ODD_MULTIPLES: List[Tuple[int, int]] | None = None
+
+
+def g_odd_multiples() -> List[Tuple[int, int]]:
+    global G_ODD_MULTIPLES
+    if G_ODD_MULTIPLES is None:
+        G_ODD_MULTIPLES = jacobian.odd_multiples(G.x.num, G.y.num, G_WNAF_WIDTH)
+    return G_ODD_MULTIPLES
+
+
+def g_lambda_odd_multiples() -> List[Tuple[int, int]]:
+    global G_LAMBDA_ODD_MULTIPLES
+    if G_LAMBDA_ODD_MULTIPLES is None:
+        G_LAMBDA_ODD_MULTIPLES = jacobian.endomorphism(g_odd_multiples())
+    return G_LAMBDA_ODD_MULTIPLES
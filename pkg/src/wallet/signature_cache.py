@@ -0,0 +1,43 @@
+import hashlib
+import threading
+from multiprocessing.managers import DictProxy, ValueProxy, Value
+from typing import List
+
+
+class SignatureCache:
+    """
+    Bounded cache of successful signature verifications, shared between node processes
+    Entries live in two generations: when current one is full, older one is dropped and reused
+    """
+    MAX_SIZE = 100000
+
+    def __init__(
+            self,
+            generations: List[DictProxy] | None = None,
+            current: ValueProxy | None = None,
+            lock=None,
+            max_size: int = MAX_SIZE
+    ):
+        # Local (single process) cache if shared containers are not given
+        self.generations: List[DictProxy[bytes, bool]] = generations or [dict(), dict()]
+        self.current: ValueProxy[int] = current or Value("i", 0)
+        self.lock = lock or threading.Lock()
+        self.max_size: int = max_size
+
+    @staticmethod
+    def key(z: int, sec_pubkey: bytes, der_signature: bytes) -> bytes:
+        return hashlib.sha256(z.to_bytes(32, "big") + sec_pubkey + der_signature).digest()
+
+    def __contains__(self, check) -> bool:
+        key = self.key(*check)
+        return any(key in generation for generation in self.generations)
+
+    def add(self, z: int, sec_pubkey: bytes, der_signature: bytes):
+        current = self.current.value
+        generation = self.generations[current]
+        generation[self.key(z, sec_pubkey, der_signature)] = True
+        if len(generation) >= self.max_size // 2:
+            with self.lock:
+                if self.current.value == current:
+                    self.generations[1 - current].clear()
+                    self.current.value = 1 - current
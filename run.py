@@ -8,7 +8,8 @@ from aiohttp import web
 
 from load_balancer import LoadBalancer
 from pkg.api import runserver
-from pkg.src import Blockchain, MemoryPool, NewBlocks, SecondaryChain, UTXOs, SyncManager
+from pkg.src import Blockchain, MemoryPool, NewBlocks, SecondaryChain, UTXOs, SyncManager, MiningStats, EventBus, \
+    SignatureVerifier, SignatureCache
 
 
 def try_to_kill_process(p):
@@ -49,6 +50,9 @@ if __name__ == "__main__":
     localPort = int(config['NODE'].get('port', "1111"))
     minerWallet = config['NODE'].get('wallet', "")
     mine = bool(int(config['NODE'].get('mine', "1")))
+    mining_workers = int(config['NODE'].get('mining_workers', "1"))
+    job_port = int(config['NODE'].get('job_port', "0"))
+    verify_workers = int(config['NODE'].get('verify_workers', "0"))
 
     """Database"""
     db_name = config['DB']['db_name']
@@ -70,9 +74,17 @@ if __name__ == "__main__":
 
     with Manager() as manager:
         utxos = UTXOs(manager.dict(), manager.dict())
-        MemPool = MemoryPool(manager.dict(), utxos)
-        newBlockAvailable = NewBlocks(manager.dict())
+        events = EventBus(manager.list(), manager.Condition(), manager.Value("i", 0))
+        signature_cache = SignatureCache([manager.dict(), manager.dict()], manager.Value("i", 0), manager.Lock())
+        # Process pool runs only in blockchain process, which checks blocks and downloaded batches
+        # API workers and SyncManager check single transactions inline against the same cache
+        verifier = SignatureVerifier(verify_workers, signature_cache)
+        memory_pool = manager.dict()
+        MemPool = MemoryPool(memory_pool, utxos, events, verifier)
+        InlineMemPool = MemoryPool(memory_pool, utxos, events, verifier.inline())
+        newBlockAvailable = NewBlocks(manager.dict(), events=events, verifier=verifier)
         secondaryChain = SecondaryChain(manager.dict())
+        miningStats = MiningStats(manager.dict())
         api_treads = []
         lb_process = None
 
@@ -86,7 +98,7 @@ if __name__ == "__main__":
                 worker_ports = []
                 for i in range(api_cores):
                     port = api_port + 1 + i
-                    api = Process(target=runserver, args=(utxos, MemPool, db_name, db_host, db_port, port))
+                    api = Process(target=runserver, args=(utxos, InlineMemPool, miningStats, db_name, db_host, db_port, port))
                     api.start()
                     api_treads.append(api)
                     worker_ports.append(port)
@@ -94,7 +106,7 @@ if __name__ == "__main__":
                 lb_process.start()
 
             """ Start Server and Listen for miner requests """
-            sync = SyncManager(localHost, localPort, db_name, db_host, db_port, newBlockAvailable, secondaryChain, MemPool, utxos)
+            sync = SyncManager(localHost, localPort, db_name, db_host, db_port, newBlockAvailable, secondaryChain, InlineMemPool, utxos)
             startServer = Process(target=sync.spinUpTheServer)
 
             """Run blockchain"""
@@ -103,13 +115,17 @@ if __name__ == "__main__":
                 MemPool,
                 newBlockAvailable,
                 secondaryChain,
+                events,
                 localHost,
                 localPort,
                 db_name,
                 db_host,
                 db_port,
                 parent_node=f"{parentHost}:{parentPort}",
-                mine=mine
+                mine=mine,
+                mining_workers=mining_workers,
+                job_port=job_port,
+                mining_stats=miningStats
             )
             startServer.start()
             blockchain.main(minerWallet)